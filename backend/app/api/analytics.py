@@ -74,24 +74,18 @@ async def get_improvement_recommendations(
         
         logger.info(f"Fetching improvement recommendations for user {user_id}")
         
-        # Get analytics to identify recurring weaknesses
-        analytics = await AnalyticsService.calculate_user_analytics(user_id)
-        
-        # Get the most recent evaluation for current recommendations
-        from app.db.mongodb import get_database
-        db = get_database()
+        # Evaluation history and latest evaluation in a single query
+        dashboard = await AnalyticsService.get_user_dashboard(user_id)
         
-        if db is None:
+        if dashboard is None:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Database not available"
             )
         
-        # Fetch most recent evaluation
-        latest_evaluation = await db.session_evaluations.find_one(
-            {"user_id": user_id},
-            sort=[("created_at", -1)]
-        )
+        # Analytics identify recurring weaknesses
+        analytics = AnalyticsService.build_analytics(dashboard["evaluations"])
+        latest_evaluation = dashboard["latest"]
         
         if not latest_evaluation:
             return {
@@ -7,13 +7,15 @@ from app.models.user import (
     ForgotPasswordRequest, ForgotPasswordResponse,
     ResetPasswordRequest, ResetPasswordResponse
 )
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import ahash_password, averify_password, create_access_token, password_needs_rehash
 from app.core.dependencies import get_current_user
 from app.db.mongodb import get_database
+from pymongo.errors import DuplicateKeyError
 from datetime import datetime, timedelta
-from uuid import uuid4
+from app.models._factories import new_uuid
 import logging
 import os
+import secrets
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +28,7 @@ async def signup(user_data: UserCreate):
     Create a new user account.
     
     - Validates email format and password length (min 8 chars)
-    - Checks if email already exists
+    - Rejects emails that are already registered
     - Hashes password with Argon2
     - Generates UUID for user_id
     - Stores user in MongoDB users collection
@@ -41,37 +43,32 @@ async def signup(user_data: UserCreate):
             detail="Database connection not available"
         )
     
-    # Check if email already exists
-    existing_user = await db.users.find_one({"email": user_data.email})
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
     # Create user document
-    user_id = str(uuid4())
-    hashed_password = hash_password(user_data.password)
+    user_id = new_uuid()
+    hashed_password = await ahash_password(user_data.password)
     
+    now = datetime.utcnow()
     user_doc = {
         "user_id": user_id,
         "email": user_data.email,
         "password_hash": hashed_password,
         "name": user_data.name,
         "activation_state": "new",
-        "created_at": datetime.utcnow(),
-        "last_active_at": datetime.utcnow()
+        "created_at": now,
+        "last_active_at": now
     }
     
-    # Insert user into database
+    # Insert user into database; the unique index on email (created at
+    # startup) rejects already registered addresses
     try:
         await db.users.insert_one(user_doc)
         
-        # Create unique index on user_id and email if not exists
-        await db.users.create_index("user_id", unique=True)
-        await db.users.create_index("email", unique=True)
-        
         logger.info(f"New user created: {user_id}")
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     except Exception as e:
         logger.error(f"Error creating user: {e}")
         raise HTTPException(
@@ -100,7 +97,7 @@ async def login(credentials: UserLogin):
     Authenticate existing user and return JWT token.
     
     - Finds user by email in MongoDB
-    - Verifies password using verify_password()
+    - Verifies password using averify_password() off the event loop
     - Returns 401 if invalid credentials
     - Generates new JWT token if valid
     - Updates last_active_at timestamp
@@ -115,7 +112,10 @@ async def login(credentials: UserLogin):
         )
     
     # Find user by email
-    user = await db.users.find_one({"email": credentials.email})
+    user = await db.users.find_one(
+        {"email": credentials.email},
+        {"user_id": 1, "email": 1, "name": 1, "password_hash": 1, "_id": 0}
+    )
     
     if not user:
         raise HTTPException(
@@ -124,17 +124,22 @@ async def login(credentials: UserLogin):
         )
     
     # Verify password
-    if not verify_password(credentials.password, user["password_hash"]):
+    if not await averify_password(credentials.password, user["password_hash"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
     
-    # Update last_active_at
+    # Update last_active_at, upgrading bcrypt or outdated Argon2 hashes while
+    # the plain password is at hand
+    login_update = {"last_active_at": datetime.utcnow()}
+    if password_needs_rehash(user["password_hash"]):
+        login_update["password_hash"] = await ahash_password(credentials.password)
+    
     try:
         await db.users.update_one(
             {"user_id": user["user_id"]},
-            {"$set": {"last_active_at": datetime.utcnow()}}
+            {"$set": login_update}
         )
     except Exception as e:
         logger.error(f"Error updating last_active_at: {e}")
@@ -189,7 +194,10 @@ async def get_current_user_info(current_user: dict = Depends(get_current_user)):
         )
     
     # Fetch user from database
-    user = await db.users.find_one({"user_id": current_user["user_id"]})
+    user = await db.users.find_one(
+        {"user_id": current_user["user_id"]},
+        {"user_id": 1, "email": 1, "name": 1, "activation_state": 1, "_id": 0}
+    )
     
     if not user:
         raise HTTPException(
@@ -201,7 +209,7 @@ async def get_current_user_info(current_user: dict = Depends(get_current_user)):
         user_id=user["user_id"],
         email=user["email"],
         name=user.get("name"),
-        activation_state=user["activation_state"]
+        activation_state=user.get("activation_state")
     )
 
 
@@ -227,7 +235,7 @@ async def forgot_password(request: ForgotPasswordRequest):
         )
     
     # Find user by email
-    user = await db.users.find_one({"email": request.email})
+    user = await db.users.find_one({"email": request.email}, {"user_id": 1, "_id": 0})
     
     if not user:
         # For security, don't reveal if email exists or not
@@ -239,8 +247,8 @@ async def forgot_password(request: ForgotPasswordRequest):
             reset_link="https://prapp-frontend.vercel.app/reset-password?token=invalid"
         )
     
-    # Generate reset token
-    reset_token = str(uuid4())
+    # Generate reset token (256 bits, URL-safe)
+    reset_token = secrets.token_urlsafe(32)
     expires_at = datetime.utcnow() + timedelta(hours=1)
     
     # Save token to user document
@@ -296,7 +304,10 @@ async def reset_password(request: ResetPasswordRequest):
         )
     
     # Find user by reset token
-    user = await db.users.find_one({"reset_token": request.token})
+    user = await db.users.find_one(
+        {"reset_token": request.token},
+        {"user_id": 1, "reset_token_expires_at": 1, "_id": 0}
+    )
     
     if not user:
         raise HTTPException(
@@ -305,7 +316,8 @@ async def reset_password(request: ResetPasswordRequest):
         )
     
     # Check if token has expired
-    if not user.get("reset_token_expires_at") or user["reset_token_expires_at"] < datetime.utcnow():
+    now = datetime.utcnow()
+    if not user.get("reset_token_expires_at") or user["reset_token_expires_at"] < now:
         # Clear expired token
         await db.users.update_one(
             {"user_id": user["user_id"]},
@@ -322,7 +334,7 @@ async def reset_password(request: ResetPasswordRequest):
         )
     
     # Hash new password
-    new_password_hash = hash_password(request.new_password)
+    new_password_hash = await ahash_password(request.new_password)
     
     # Update password and clear reset token
     try:
@@ -331,7 +343,7 @@ async def reset_password(request: ResetPasswordRequest):
             {
                 "$set": {
                     "password_hash": new_password_hash,
-                    "last_active_at": datetime.utcnow()
+                    "last_active_at": now
                 },
                 "$unset": {
                     "reset_token": "",
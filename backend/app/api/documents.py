@@ -8,10 +8,10 @@ from pathlib import Path
 from typing import List
 from datetime import datetime
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.core.dependencies import get_current_user, get_database
-from app.models.user import UserInDB
+from app.models._factories import new_id
 from app.models.document import (
     DocumentInDB,
     DocumentResponse,
@@ -22,6 +22,7 @@ from app.models.document import (
 )
 from app.services.document_processor import DocumentProcessor
 from app.services.rag_service import get_rag_service
+from app.services import talk_points_cache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -90,6 +91,9 @@ async def process_and_index_document(
             {"$set": update_data}
         )
         
+        # Cached talk points were grounded on the previous knowledge base
+        await talk_points_cache.invalidate_user(db, user_id)
+        
         logger.info(f"Successfully indexed document {document_id} with {chunk_count} chunks")
         
     except Exception as e:
@@ -111,7 +115,7 @@ async def process_and_index_document(
 async def upload_document(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    current_user: UserInDB = Depends(get_current_user),
+    current_user: dict = Depends(get_current_user),
     db = Depends(get_database)
 ):
     """
@@ -141,8 +145,7 @@ async def upload_document(
             )
         
         # Create document record
-        from uuid import uuid4
-        document_id = str(uuid4())
+        document_id = new_id()
         
         # Save file to disk
         file_extension = Path(file.filename).suffix
@@ -157,7 +160,7 @@ async def upload_document(
         # Create document record in database
         document = DocumentInDB(
             document_id=document_id,
-            user_id=current_user.user_id,
+            user_id=current_user["user_id"],
             filename=file.filename,
             file_path=str(file_path),
             content_type=file.content_type,
@@ -172,7 +175,7 @@ async def upload_document(
         background_tasks.add_task(
             process_and_index_document,
             document_id=document_id,
-            user_id=current_user.user_id,
+            user_id=current_user["user_id"],
             file_path=str(file_path),
             content_type=file.content_type,
             db=db
@@ -199,7 +202,7 @@ async def upload_document(
 async def list_documents(
     limit: int = 20,
     offset: int = 0,
-    current_user: UserInDB = Depends(get_current_user),
+    current_user: dict = Depends(get_current_user),
     db = Depends(get_database)
 ):
     """
@@ -209,11 +212,11 @@ async def list_documents(
     """
     try:
         # Get total count
-        total = await db.documents.count_documents({"user_id": current_user.user_id})
+        total = await db.documents.count_documents({"user_id": current_user["user_id"]})
         
         # Get documents
         cursor = db.documents.find(
-            {"user_id": current_user.user_id}
+            {"user_id": current_user["user_id"]}
         ).sort("upload_date", -1).skip(offset).limit(limit)
         
         documents = []
@@ -250,7 +253,7 @@ async def list_documents(
 @router.get("/{document_id}", response_model=DocumentResponse)
 async def get_document(
     document_id: str,
-    current_user: UserInDB = Depends(get_current_user),
+    current_user: dict = Depends(get_current_user),
     db = Depends(get_database)
 ):
     """
@@ -259,7 +262,7 @@ async def get_document(
     try:
         doc = await db.documents.find_one({
             "document_id": document_id,
-            "user_id": current_user.user_id
+            "user_id": current_user["user_id"]
         })
         
         if not doc:
@@ -295,7 +298,7 @@ async def get_document(
 @router.delete("/{document_id}", status_code=status.HTTP_200_OK)
 async def delete_document(
     document_id: str,
-    current_user: UserInDB = Depends(get_current_user),
+    current_user: dict = Depends(get_current_user),
     db = Depends(get_database)
 ):
     """
@@ -308,7 +311,7 @@ async def delete_document(
         # Find document
         doc = await db.documents.find_one({
             "document_id": document_id,
-            "user_id": current_user.user_id
+            "user_id": current_user["user_id"]
         })
         
         if not doc:
@@ -320,7 +323,7 @@ async def delete_document(
         # Delete from vector store
         try:
             rag_service = get_rag_service(settings.OPENAI_API_KEY)
-            await rag_service.delete_document(current_user.user_id, document_id)
+            await rag_service.delete_document(current_user["user_id"], document_id)
             logger.info(f"Deleted document {document_id} from vector store")
         except Exception as e:
             logger.warning(f"Error deleting from vector store: {e}")
@@ -337,7 +340,10 @@ async def delete_document(
         # Delete from database
         await db.documents.delete_one({"document_id": document_id})
         
-        return JSONResponse(
+        # Cached talk points may be grounded on this document
+        await talk_points_cache.invalidate_user(db, current_user["user_id"])
+        
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
             content={"message": "Document deleted successfully"}
         )
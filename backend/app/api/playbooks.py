@@ -2,7 +2,7 @@
 Playbooks API endpoints for Sales Playbook Builder feature.
 Handles CRUD operations, scenario management, and AI-powered content generation.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from typing import Optional, List
 from datetime import datetime
 import logging
@@ -13,6 +13,7 @@ from app.models.playbook import (
     PlaybookInDB,
     PlaybookResponse,
     PlaybookListResponse,
+    PLAYBOOK_LIST_ADAPTER,
     PlaybookStatus,
     Scenario,
     ScenarioCreate,
@@ -21,6 +22,7 @@ from app.models.playbook import (
     GeneratePlaybookRequest,
     GenerateScenarioContentRequest
 )
+from app.models._adapters import adapter_for
 from app.core.dependencies import get_current_user
 from app.db.mongodb import get_database
 from app.services.openai_service import openai_service
@@ -159,21 +161,23 @@ async def list_playbooks(
         total = await db.playbooks.count_documents(query)
         
         # Fetch playbooks with pagination
-        cursor = db.playbooks.find(query).sort("updated_at", -1).skip(offset).limit(limit)
-        playbooks = await cursor.to_list(length=limit)
-        
-        # Convert to response models
-        playbook_responses = [PlaybookResponse(**playbook) for playbook in playbooks]
-        
-        logger.info(f"Listed {len(playbook_responses)} playbooks for user {current_user['user_id']}")
-        
-        return PlaybookListResponse(
-            playbooks=playbook_responses,
+        cursor = db.playbooks.find(query, {"_id": 0}).sort("updated_at", -1).skip(offset).limit(limit)
+        playbooks = PLAYBOOK_LIST_ADAPTER.validate_python(await cursor.to_list(length=limit))
+        
+        # The page is already validated, so the wrapper is built without
+        # validation and the whole body is encoded to JSON by pydantic-core
+        # in one pass, without an intermediate dict
+        page = PlaybookListResponse.model_construct(
+            playbooks=playbooks,
             total=total,
             limit=limit,
             offset=offset
         )
         
+        logger.info(f"Listed {len(playbooks)} playbooks for user {current_user['user_id']}")
+        
+        return Response(content=page.model_dump_json(), media_type="application/json")
+        
     except Exception as e:
         logger.error(f"Error listing playbooks: {str(e)}")
         raise HTTPException(
@@ -206,7 +210,8 @@ async def get_playbook(
     
     logger.info(f"Retrieved playbook {playbook_id} for user {current_user['user_id']}")
     
-    return PlaybookResponse(**playbook)
+    # Validated once by FastAPI against response_model
+    return PlaybookInDB.from_db(playbook)
 
 
 @router.put("/{playbook_id}", response_model=PlaybookResponse)
@@ -260,7 +265,7 @@ async def update_playbook(
     
     logger.info(f"Updated playbook {playbook_id} for user {current_user['user_id']}")
     
-    return PlaybookResponse(**updated_playbook)
+    return adapter_for(PlaybookResponse).validate_python(updated_playbook)
 
 
 @router.delete("/{playbook_id}", status_code=status.HTTP_200_OK)
@@ -341,12 +346,14 @@ async def add_scenario(
             competitors=scenario_data.competitors,
             content=ContentSection()
         )
+        scenario_doc = scenario.model_dump()
+        scenario_doc["content"] = scenario.content.model_dump(exclude_defaults=True)
         
         # Add scenario to playbook
         result = await db.playbooks.update_one(
             {"id": playbook_id},
             {
-                "$push": {"scenarios": scenario.model_dump()},
+                "$push": {"scenarios": scenario_doc},
                 "$set": {"updated_at": datetime.utcnow()}
             }
         )
@@ -447,7 +454,7 @@ async def update_scenario(
         
         logger.info(f"Updated scenario {scenario_id} in playbook {playbook_id}")
         
-        return Scenario(**updated_scenario)
+        return adapter_for(Scenario).validate_python(updated_scenario)
         
     except HTTPException:
         raise
@@ -638,9 +645,10 @@ async def generate_scenario_content(
             db=db
         )
         
-        # Update scenario content in database
+        # Update scenario content in database; empty sections are left out
+        # and filled back in by ContentSection when the playbook is read
         update_query = {
-            f"scenarios.{scenario_index}.content": content.model_dump(),
+            f"scenarios.{scenario_index}.content": content.model_dump(exclude_defaults=True),
             "updated_at": datetime.utcnow()
         }
         
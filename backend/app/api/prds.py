@@ -4,6 +4,7 @@ Handles CRUD operations for PRDs with ownership validation.
 Includes AI-powered PRD generation, enhancement, and evaluation.
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 from datetime import datetime
 from app.models.prd import (
@@ -11,9 +12,11 @@ from app.models.prd import (
     PRDUpdate,
     PRDResponse,
     PRDListResponse,
+    PRD_LIST_ADAPTER,
     PRDInDB,
     PRDStatus
 )
+from app.models._adapters import adapter_for
 from app.models.ai_models import (
     PRDGenerateRequest,
     PRDEnhanceRequest,
@@ -358,17 +361,20 @@ async def list_prds(
     cursor = db.prds.find(query).sort(sort_by, sort_direction).skip(offset).limit(limit)
     prds = await cursor.to_list(length=limit)
     
-    # Convert to response models
-    prd_responses = [PRDResponse(**prd) for prd in prds]
+    # Validate and serialize the page in one pass; returning the body
+    # directly skips FastAPI re-validating it against PRDListResponse
+    prd_responses = PRD_LIST_ADAPTER.dump_python(
+        PRD_LIST_ADAPTER.validate_python(prds), mode="json"
+    )
     
     logger.info(f"Listed {len(prd_responses)} PRDs for user {current_user['user_id']}")
     
-    return PRDListResponse(
-        prds=prd_responses,
-        total=total,
-        limit=limit,
-        offset=offset
-    )
+    return ORJSONResponse({
+        "prds": prd_responses,
+        "total": total,
+        "limit": limit,
+        "offset": offset
+    })
 
 
 @router.get("/{prd_id}", response_model=PRDResponse)
@@ -395,7 +401,8 @@ async def get_prd(
     
     logger.info(f"Retrieved PRD {prd_id} for user {current_user['user_id']}")
     
-    return PRDResponse(**prd)
+    # Validated once by FastAPI against response_model
+    return PRDInDB.from_db(prd)
 
 
 @router.patch("/{prd_id}", response_model=PRDResponse)
@@ -449,7 +456,7 @@ async def update_prd(
     
     logger.info(f"Updated PRD {prd_id} for user {current_user['user_id']}")
     
-    return PRDResponse(**updated_prd)
+    return adapter_for(PRDResponse).validate_python(updated_prd)
 
 
 @router.delete("/{prd_id}", status_code=status.HTTP_200_OK)
@@ -2,26 +2,30 @@
 Session management API endpoints for Sales Call Prep.
 Handles session creation, chat messages, evaluation, and history with RAG integration.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import Optional, List
 from datetime import datetime
+import hashlib
 from app.models.session import (
     SessionCreate,
     SessionInDB,
     SessionResponse,
+    SessionDetailResponse,
     SessionListResponse,
+    SESSION_LIST_ADAPTER,
     SessionStatus,
     SendMessageRequest,
     SendMessageResponse,
-    SessionUpdate,
-    ChatMessage
+    SessionUpdate
 )
+from app.models._adapters import adapter_for
 from app.models.session_evaluation import (
     SessionEvaluationResponse,
     EvaluateSessionRequest
 )
-from app.core.dependencies import get_current_user
-from app.db.mongodb import get_database
+from app.core.dependencies import get_current_user, get_current_user_id
+from app.db.mongodb import get_collection
 from app.services.openai_service import openai_service
 from app.services.rag_service import get_rag_service
 from app.core.config import settings
@@ -32,14 +36,34 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
 
-async def verify_session_ownership(session_id: str, user_id: str, db) -> dict:
+# Fields needed to check ownership and status; large fields such as the
+# transcript and context_payload are only loaded by callers that use them
+SESSION_OWNERSHIP_PROJECTION = {"user_id": 1, "status": 1, "session_id": 1, "_id": 0}
+
+# Fields needed to generate AI replies and evaluations
+SESSION_CONVERSATION_PROJECTION = {
+    **SESSION_OWNERSHIP_PROJECTION,
+    "preparation_type": 1,
+    "meeting_subtype": 1,
+    "context_payload": 1,
+    "context_prompt": 1,
+    "transcript": 1,
+    "completed_at": 1,
+}
+
+
+async def verify_session_ownership(
+    session_id: str,
+    user_id: str,
+    projection: Optional[dict] = SESSION_OWNERSHIP_PROJECTION
+) -> dict:
     """
     Verify that the session belongs to the current user.
     
     Args:
         session_id: Session identifier
         user_id: Current user's ID
-        db: Database instance
+        projection: Fields to return; None loads the full document
         
     Returns:
         Session document if found and owned by user
@@ -47,7 +71,7 @@ async def verify_session_ownership(session_id: str, user_id: str, db) -> dict:
     Raises:
         HTTPException: If session not found or user doesn't own it
     """
-    session = await db.sessions.find_one({"session_id": session_id})
+    session = await get_collection("sessions").find_one({"session_id": session_id}, projection)
     
     if not session:
         raise HTTPException(
@@ -64,11 +88,49 @@ async def verify_session_ownership(session_id: str, user_id: str, db) -> dict:
     return session
 
 
+def session_json_response(session: SessionResponse, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Encode a session model straight to a JSON response.
+    
+    The body is produced by pydantic-core in one pass, and returning a
+    Response skips FastAPI re-validating the transcript against response_model.
+    
+    Args:
+        session: Validated session (or session detail) model
+        status_code: HTTP status code of the response
+        
+    Returns:
+        JSON response with the encoded session
+    """
+    return Response(
+        content=SessionResponse.to_json_bytes(session),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+def build_evaluation_etag(evaluation: dict) -> str:
+    """
+    Build an ETag for a stored session evaluation.
+    
+    Every evaluation run gets a new evaluation_id, so its hash changes whenever
+    the evaluation is regenerated, including forced re-evaluations of an
+    unchanged transcript. created_at is left out: MongoDB truncates it to
+    milliseconds, so the stored value would not hash like the one just written.
+    
+    Args:
+        evaluation: Session evaluation document
+        
+    Returns:
+        Quoted ETag header value
+    """
+    return f'"{hashlib.sha256(evaluation["evaluation_id"].encode()).hexdigest()[:16]}"'
+
+
 @router.post("", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
 async def create_session(
     session_data: SessionCreate,
-    current_user: dict = Depends(get_current_user),
-    db=Depends(get_database)
+    current_user: dict = Depends(get_current_user)
 ):
     """
     Create a new preparation session.
@@ -79,7 +141,6 @@ async def create_session(
     Args:
         session_data: Session creation data
         current_user: Current authenticated user
-        db: Database instance
         
     Returns:
         Created session object
@@ -95,12 +156,20 @@ async def create_session(
             "deal_stage": session_data.deal_stage.value if session_data.deal_stage else None
         }
         
+        # Build the static system prompt once so every turn reuses it
+        context_prompt = openai_service.build_session_context_prompt(
+            session_data.preparation_type.value,
+            session_data.meeting_subtype,
+            context_payload
+        )
+        
         # Create session document
         session = SessionInDB(
             user_id=current_user["user_id"],
             preparation_type=session_data.preparation_type,
             meeting_subtype=session_data.meeting_subtype,
             context_payload=context_payload,
+            context_prompt=context_prompt,
             transcript=[],
             status=SessionStatus.IN_PROGRESS
         )
@@ -109,7 +178,7 @@ async def create_session(
         session_dict = session.model_dump()
         
         # Insert into database
-        result = await db.sessions.insert_one(session_dict)
+        result = await get_collection("sessions").insert_one(session_dict)
         
         if not result.inserted_id:
             raise HTTPException(
@@ -119,7 +188,10 @@ async def create_session(
         
         logger.info(f"Created session {session.session_id} for user {current_user['user_id']}")
         
-        return SessionResponse(**session_dict)
+        return session_json_response(
+            adapter_for(SessionResponse).validate_python(session_dict),
+            status_code=status.HTTP_201_CREATED
+        )
         
     except Exception as e:
         logger.error(f"Error creating session: {str(e)}")
@@ -134,8 +206,7 @@ async def list_sessions(
     status_filter: Optional[SessionStatus] = Query(None, description="Filter by status"),
     limit: int = Query(10, ge=1, le=100, description="Number of sessions to return"),
     offset: int = Query(0, ge=0, description="Number of sessions to skip"),
-    current_user: dict = Depends(get_current_user),
-    db=Depends(get_database)
+    current_user: dict = Depends(get_current_user)
 ):
     """
     List all sessions for the authenticated user with filtering and pagination.
@@ -145,7 +216,6 @@ async def list_sessions(
         limit: Maximum number of sessions to return
         offset: Number of sessions to skip
         current_user: Current authenticated user
-        db: Database instance
         
     Returns:
         Paginated list of sessions
@@ -158,23 +228,26 @@ async def list_sessions(
             query["status"] = status_filter.value
         
         # Get total count
-        total = await db.sessions.count_documents(query)
+        total = await get_collection("sessions").count_documents(query)
         
         # Fetch sessions with pagination
-        cursor = db.sessions.find(query).sort("created_at", -1).skip(offset).limit(limit)
+        cursor = get_collection("sessions").find(query).sort("created_at", -1).skip(offset).limit(limit)
         sessions = await cursor.to_list(length=limit)
         
-        # Convert to response models
-        session_responses = [SessionResponse(**session) for session in sessions]
+        # Validate and serialize the page in one pass; returning the body
+        # directly skips FastAPI re-validating it against SessionListResponse
+        session_responses = SESSION_LIST_ADAPTER.dump_python(
+            SESSION_LIST_ADAPTER.validate_python(sessions), mode="json"
+        )
         
         logger.info(f"Listed {len(session_responses)} sessions for user {current_user['user_id']}")
         
-        return SessionListResponse(
-            sessions=session_responses,
-            total=total,
-            limit=limit,
-            offset=offset
-        )
+        return ORJSONResponse({
+            "sessions": session_responses,
+            "total": total,
+            "limit": limit,
+            "offset": offset
+        })
         
     except Exception as e:
         logger.error(f"Error listing sessions: {str(e)}")
@@ -184,19 +257,54 @@ async def list_sessions(
         )
 
 
+@router.get("/stream")
+async def stream_sessions(
+    status_filter: Optional[SessionStatus] = Query(None, description="Filter by status"),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Stream all sessions for the authenticated user as NDJSON.
+    
+    Each line is one session in the SessionResponse shape, newest first.
+    Sessions are validated and encoded one at a time as the cursor is read,
+    so memory stays flat however many sessions (and transcripts) the user has.
+    
+    Args:
+        status_filter: Optional status filter
+        current_user: Current authenticated user
+        
+    Returns:
+        Streaming application/x-ndjson response
+    """
+    query = {"user_id": current_user["user_id"]}
+    
+    if status_filter:
+        query["status"] = status_filter.value
+    
+    cursor = get_collection("sessions").find(query, {"_id": 0}).sort("created_at", -1)
+    
+    async def stream():
+        count = 0
+        async for doc in cursor:
+            session = adapter_for(SessionResponse).validate_python(doc)
+            yield SessionResponse.to_json_bytes(session) + b"\n"
+            count += 1
+        logger.info(f"Streamed {count} sessions for user {current_user['user_id']}")
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @router.get("/{session_id}", response_model=SessionResponse)
 async def get_session(
     session_id: str,
-    current_user: dict = Depends(get_current_user),
-    db=Depends(get_database)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get a specific session by ID.
     
     Args:
         session_id: Session identifier
-        current_user: Current authenticated user
-        db: Database instance
+        user_id: Current authenticated user's ID
         
     Returns:
         Session object with full transcript
@@ -204,19 +312,62 @@ async def get_session(
     Raises:
         HTTPException: If session not found or user doesn't own it
     """
-    session = await verify_session_ownership(session_id, current_user["user_id"], db)
+    session = await verify_session_ownership(session_id, user_id, projection=None)
     
-    logger.info(f"Retrieved session {session_id} for user {current_user['user_id']}")
+    logger.info(f"Retrieved session {session_id} for user {user_id}")
     
-    return SessionResponse(**session)
+    return session_json_response(adapter_for(SessionResponse).validate_python(session))
+
+
+@router.get("/{session_id}/full", response_model=SessionDetailResponse)
+async def get_session_full(
+    session_id: str,
+    user_id: str = Depends(get_current_user_id)
+):
+    """
+    Get a session together with its evaluation in a single round-trip.
+    
+    Uses a $lookup from sessions into session_evaluations instead of
+    separate get_session and get_session_evaluation calls.
+    
+    Args:
+        session_id: Session identifier
+        user_id: Current authenticated user's ID
+        
+    Returns:
+        Session object with full transcript and evaluation (if any)
+        
+    Raises:
+        HTTPException: If session not found for this user
+    """
+    pipeline = [
+        {"$match": {"session_id": session_id, "user_id": user_id}},
+        {"$lookup": {
+            "from": "session_evaluations",
+            "localField": "session_id",
+            "foreignField": "session_id",
+            "as": "evaluation"
+        }},
+        {"$unwind": {"path": "$evaluation", "preserveNullAndEmptyArrays": True}},
+    ]
+    docs = await get_collection("sessions").aggregate(pipeline).to_list(1)
+    
+    if not docs:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Session with id {session_id} not found"
+        )
+    
+    logger.info(f"Retrieved session {session_id} with evaluation for user {user_id}")
+    
+    return session_json_response(adapter_for(SessionDetailResponse).validate_python(docs[0]))
 
 
 @router.patch("/{session_id}", response_model=SessionResponse)
 async def update_session(
     session_id: str,
     session_update: SessionUpdate,
-    current_user: dict = Depends(get_current_user),
-    db=Depends(get_database)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Update a session's status.
@@ -224,8 +375,7 @@ async def update_session(
     Args:
         session_id: Session identifier
         session_update: Fields to update
-        current_user: Current authenticated user
-        db: Database instance
+        user_id: Current authenticated user's ID
         
     Returns:
         Updated session object
@@ -234,7 +384,7 @@ async def update_session(
         HTTPException: If session not found or user doesn't own it
     """
     # Verify ownership
-    await verify_session_ownership(session_id, current_user["user_id"], db)
+    await verify_session_ownership(session_id, user_id)
     
     # Build update document
     update_data = session_update.model_dump(exclude_unset=True)
@@ -246,7 +396,7 @@ async def update_session(
         )
     
     # Update in database
-    result = await db.sessions.update_one(
+    result = await get_collection("sessions").update_one(
         {"session_id": session_id},
         {"$set": update_data}
     )
@@ -255,26 +405,24 @@ async def update_session(
         logger.warning(f"No changes made to session {session_id}")
     
     # Fetch and return updated session
-    updated_session = await db.sessions.find_one({"session_id": session_id})
+    updated_session = await get_collection("sessions").find_one({"session_id": session_id})
     
-    logger.info(f"Updated session {session_id} for user {current_user['user_id']}")
+    logger.info(f"Updated session {session_id} for user {user_id}")
     
-    return SessionResponse(**updated_session)
+    return session_json_response(adapter_for(SessionResponse).validate_python(updated_session))
 
 
 @router.delete("/{session_id}", status_code=status.HTTP_200_OK)
 async def delete_session(
     session_id: str,
-    current_user: dict = Depends(get_current_user),
-    db=Depends(get_database)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Delete a session (soft delete by setting status to archived).
     
     Args:
         session_id: Session identifier
-        current_user: Current authenticated user
-        db: Database instance
+        user_id: Current authenticated user's ID
         
     Returns:
         Success message
@@ -283,10 +431,10 @@ async def delete_session(
         HTTPException: If session not found or user doesn't own it
     """
     # Verify ownership
-    await verify_session_ownership(session_id, current_user["user_id"], db)
+    await verify_session_ownership(session_id, user_id)
     
     # Soft delete by setting status to archived
-    result = await db.sessions.update_one(
+    result = await get_collection("sessions").update_one(
         {"session_id": session_id},
         {"$set": {"status": SessionStatus.ARCHIVED.value}}
     )
@@ -297,7 +445,7 @@ async def delete_session(
             detail="Failed to delete session"
         )
     
-    logger.info(f"Deleted (archived) session {session_id} for user {current_user['user_id']}")
+    logger.info(f"Deleted (archived) session {session_id} for user {user_id}")
     
     return {"message": "Session deleted successfully", "session_id": session_id}
 
@@ -306,8 +454,7 @@ async def delete_session(
 async def send_message(
     session_id: str,
     request: SendMessageRequest,
-    current_user: dict = Depends(get_current_user),
-    db=Depends(get_database)
+    current_user: dict = Depends(get_current_user)
 ):
     """
     Send a message in a session and receive AI response.
@@ -320,7 +467,6 @@ async def send_message(
         session_id: Session identifier
         request: Message request with user's message
         current_user: Current authenticated user
-        db: Database instance
         
     Returns:
         AI response and current turn number
@@ -330,7 +476,11 @@ async def send_message(
     """
     try:
         # Verify ownership and get session
-        session = await verify_session_ownership(session_id, current_user["user_id"], db)
+        session = await verify_session_ownership(
+            session_id,
+            current_user["user_id"],
+            projection=SESSION_CONVERSATION_PROJECTION
+        )
         
         # Validate session is in progress
         if session["status"] != SessionStatus.IN_PROGRESS.value:
@@ -341,16 +491,10 @@ async def send_message(
         
         logger.info(f"Processing message for session {session_id}")
         
-        # Create user message
-        user_message = ChatMessage(
-            role="user",
-            message=request.message,
-            timestamp=datetime.utcnow()
-        )
-        
-        # Add user message to transcript
+        # Add user message to the in-memory transcript used for the prompt;
+        # the stored copy is timestamped by MongoDB when it is appended below
         transcript = session.get("transcript", [])
-        transcript.append(user_message.model_dump())
+        transcript.append({"role": "user", "message": request.message})
         
         # Query RAG service for relevant context (for Sales sessions)
         retrieved_context = None
@@ -381,33 +525,50 @@ async def send_message(
             meeting_subtype=session.get("meeting_subtype"),
             context_payload=session.get("context_payload", {}),
             transcript=transcript,
-            retrieved_context=retrieved_context
+            retrieved_context=retrieved_context,
+            context_prompt=session.get("context_prompt")
         )
         
-        # Create AI message with retrieved context IDs
-        ai_message = ChatMessage(
-            role="ai",
-            message=ai_response_text,
-            timestamp=datetime.utcnow(),
-            retrieved_context_ids=retrieved_doc_ids if retrieved_doc_ids else None
-        )
-        
-        # Add AI message to transcript
-        transcript.append(ai_message.model_dump())
-        
-        # Update session in database
-        await db.sessions.update_one(
+        # Append both messages in a single pipeline update so MongoDB stamps
+        # them with its own clock ($$NOW). Message text is wrapped in $literal
+        # so content starting with "$" is never treated as a field path.
+        await get_collection("sessions").update_one(
             {"session_id": session_id},
-            {"$set": {"transcript": transcript}}
+            [{
+                "$set": {
+                    "transcript": {
+                        "$concatArrays": [
+                            {"$ifNull": ["$transcript", []]},
+                            [
+                                {
+                                    "role": "user",
+                                    "message": {"$literal": request.message},
+                                    "timestamp": "$$NOW",
+                                    "retrieved_context_ids": None
+                                },
+                                {
+                                    "role": "ai",
+                                    "message": {"$literal": ai_response_text},
+                                    "timestamp": "$$NOW",
+                                    "retrieved_context_ids": {"$literal": retrieved_doc_ids} if retrieved_doc_ids else None
+                                }
+                            ]
+                        ]
+                    }
+                }
+            }]
         )
         
-        turn_number = len(transcript) // 2  # Each turn has user + AI message
+        turn_number = (len(transcript) + 1) // 2  # Each turn has user + AI message
         
         logger.info(f"Message processed for session {session_id}, turn {turn_number}")
         
-        return SendMessageResponse(
-            ai_response=ai_response_text,
-            turn_number=turn_number
+        # Encoded directly, so FastAPI doesn't re-validate the dataclass
+        return Response(
+            content=adapter_for(SendMessageResponse).dump_json(
+                SendMessageResponse(ai_response=ai_response_text, turn_number=turn_number)
+            ),
+            media_type="application/json"
         )
         
     except HTTPException:
@@ -423,8 +584,7 @@ async def send_message(
 @router.post("/{session_id}/complete", response_model=SessionResponse, status_code=status.HTTP_200_OK)
 async def complete_session(
     session_id: str,
-    current_user: dict = Depends(get_current_user),
-    db=Depends(get_database)
+    current_user: dict = Depends(get_current_user)
 ):
     """
     Complete a session and trigger evaluation.
@@ -436,7 +596,6 @@ async def complete_session(
     Args:
         session_id: Session identifier
         current_user: Current authenticated user
-        db: Database instance
         
     Returns:
         Updated session object
@@ -446,7 +605,15 @@ async def complete_session(
     """
     try:
         # Verify ownership and get session
-        session = await verify_session_ownership(session_id, current_user["user_id"], db)
+        # Only the transcript length is needed, so let MongoDB count it
+        session = await verify_session_ownership(
+            session_id,
+            current_user["user_id"],
+            projection={
+                **SESSION_OWNERSHIP_PROJECTION,
+                "transcript_length": {"$size": {"$ifNull": ["$transcript", []]}}
+            }
+        )
         
         # Validate session is in progress
         if session["status"] != SessionStatus.IN_PROGRESS.value:
@@ -456,8 +623,7 @@ async def complete_session(
             )
         
         # Validate minimum turns (at least 3 exchanges)
-        transcript = session.get("transcript", [])
-        if len(transcript) < 6:  # 3 turns = 6 messages (3 user + 3 AI)
+        if session.get("transcript_length", 0) < 6:  # 3 turns = 6 messages (3 user + 3 AI)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Session must have at least 3 conversation turns before completion"
@@ -467,7 +633,7 @@ async def complete_session(
         
         # Update session status
         completed_at = datetime.utcnow()
-        await db.sessions.update_one(
+        await get_collection("sessions").update_one(
             {"session_id": session_id},
             {
                 "$set": {
@@ -481,17 +647,17 @@ async def complete_session(
         # This allows the frontend to show completion immediately and fetch evaluation async
         
         # Check if this is user's first completed session - update activation state
-        user = await db.users.find_one({"user_id": current_user["user_id"]})
+        user = await get_collection("users").find_one({"user_id": current_user["user_id"]})
         
         if user and user.get("activation_state") == "new":
             # Check if this is their first completed session
-            completed_count = await db.sessions.count_documents({
+            completed_count = await get_collection("sessions").count_documents({
                 "user_id": current_user["user_id"],
                 "status": SessionStatus.COMPLETED.value
             })
             
             if completed_count == 1:  # This is their first completed session
-                await db.users.update_one(
+                await get_collection("users").update_one(
                     {"user_id": current_user["user_id"]},
                     {
                         "$set": {
@@ -503,11 +669,11 @@ async def complete_session(
                 logger.info(f"User {current_user['user_id']} activated after first session completion")
         
         # Fetch and return updated session
-        updated_session = await db.sessions.find_one({"session_id": session_id})
+        updated_session = await get_collection("sessions").find_one({"session_id": session_id})
         
         logger.info(f"Session {session_id} completed successfully")
         
-        return SessionResponse(**updated_session)
+        return session_json_response(adapter_for(SessionResponse).validate_python(updated_session))
         
     except HTTPException:
         raise
@@ -522,9 +688,10 @@ async def complete_session(
 @router.post("/{session_id}/evaluate", response_model=SessionEvaluationResponse, status_code=status.HTTP_200_OK)
 async def evaluate_session(
     session_id: str,
+    http_request: Request,
+    response: Response,
     request: EvaluateSessionRequest = EvaluateSessionRequest(),
-    current_user: dict = Depends(get_current_user),
-    db=Depends(get_database)
+    current_user: dict = Depends(get_current_user)
 ):
     """
     Evaluate a completed session using AI.
@@ -532,11 +699,16 @@ async def evaluate_session(
     Generates multi-dimensional performance scores and improvement recommendations
     based on the session transcript and context.
     
+    Responses carry an ETag derived from the stored evaluation. Clients
+    re-polling with a matching If-None-Match header get a 304 instead of the
+    evaluation body; a forced re-evaluation always produces a new ETag.
+    
     Args:
         session_id: Session identifier
+        http_request: Raw request (for the If-None-Match header)
+        response: Outgoing response (for the ETag header)
         request: Evaluation request (optional force_reevaluate flag)
         current_user: Current authenticated user
-        db: Database instance
         
     Returns:
         Comprehensive evaluation with scores and recommendations
@@ -546,7 +718,11 @@ async def evaluate_session(
     """
     try:
         # Verify ownership and get session
-        session = await verify_session_ownership(session_id, current_user["user_id"], db)
+        session = await verify_session_ownership(
+            session_id,
+            current_user["user_id"],
+            projection=SESSION_CONVERSATION_PROJECTION
+        )
         
         # Validate session is completed
         if session["status"] != SessionStatus.COMPLETED.value:
@@ -555,14 +731,21 @@ async def evaluate_session(
                 detail="Session must be completed before evaluation"
             )
         
-        logger.info(f"Evaluating session {session_id}")
-        
-        # Check if evaluation already exists
-        existing_evaluation = await db.session_evaluations.find_one({"session_id": session_id})
+        # Return the existing evaluation unless a re-evaluation is forced,
+        # short-circuiting when the client already holds it
+        if not request.force_reevaluate:
+            existing_evaluation = await get_collection("session_evaluations").find_one({"session_id": session_id})
+            
+            if existing_evaluation:
+                etag = build_evaluation_etag(existing_evaluation)
+                if http_request.headers.get("if-none-match") == etag:
+                    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+                response.headers["ETag"] = etag
+                
+                logger.info(f"Returning existing evaluation for session {session_id}")
+                return SessionEvaluationResponse(**existing_evaluation)
         
-        if existing_evaluation and not request.force_reevaluate:
-            logger.info(f"Returning existing evaluation for session {session_id}")
-            return SessionEvaluationResponse(**existing_evaluation)
+        logger.info(f"Evaluating session {session_id}")
         
         # Generate evaluation using OpenAI service
         evaluation_data = await openai_service.evaluate_session(
@@ -577,17 +760,16 @@ async def evaluate_session(
         evaluation_data["user_id"] = current_user["user_id"]
         evaluation_data["created_at"] = datetime.utcnow()
         
-        # Store or update evaluation in database
-        if existing_evaluation:
-            await db.session_evaluations.update_one(
-                {"session_id": session_id},
-                {"$set": evaluation_data}
-            )
-            logger.info(f"Updated existing evaluation for session {session_id}")
-        else:
-            await db.session_evaluations.insert_one(evaluation_data)
-            logger.info(f"Created new evaluation for session {session_id}")
+        # Store or replace evaluation in one round-trip; the unique index on
+        # session_id keeps concurrent evaluations from creating duplicates
+        await get_collection("session_evaluations").replace_one(
+            {"session_id": session_id},
+            evaluation_data,
+            upsert=True
+        )
+        logger.info(f"Stored evaluation for session {session_id}")
         
+        response.headers["ETag"] = build_evaluation_etag(evaluation_data)
         return SessionEvaluationResponse(**evaluation_data)
         
     except HTTPException:
@@ -603,8 +785,7 @@ async def evaluate_session(
 @router.get("/{session_id}/evaluation", response_model=SessionEvaluationResponse)
 async def get_session_evaluation(
     session_id: str,
-    current_user: dict = Depends(get_current_user),
-    db=Depends(get_database)
+    current_user: dict = Depends(get_current_user)
 ):
     """
     Get the evaluation results for a specific session.
@@ -612,7 +793,6 @@ async def get_session_evaluation(
     Args:
         session_id: Session identifier
         current_user: Current authenticated user
-        db: Database instance
         
     Returns:
         Evaluation results with scores and recommendations
@@ -621,10 +801,10 @@ async def get_session_evaluation(
         HTTPException: If session not found, user doesn't own it, or no evaluation exists
     """
     # Verify ownership
-    await verify_session_ownership(session_id, current_user["user_id"], db)
+    await verify_session_ownership(session_id, current_user["user_id"])
     
     # Fetch evaluation
-    evaluation = await db.session_evaluations.find_one({"session_id": session_id})
+    evaluation = await get_collection("session_evaluations").find_one({"session_id": session_id})
     
     if not evaluation:
         raise HTTPException(
@@ -2,36 +2,87 @@
 Talk Points API endpoints for generating sales call preparation materials.
 Uses RAG to create customer-specific, context-aware talk points.
 """
+import asyncio
+import json
 import logging
-from typing import List
+from typing import Any, Dict, List
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 
 from app.core.dependencies import get_current_user, get_database
-from app.models.user import UserInDB
+from app.models._factories import new_id
 from app.models.document import (
     TalkPointCreate,
     TalkPointInDB,
-    TalkPointResponse
+    TalkPointResponse,
+    TalkPointListResponse
 )
 from app.services.rag_service import get_rag_service
 from app.services.openai_service import openai_service
+from app.services import talk_points_cache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/talk-points", tags=["talk-points"])
 
+# Fields returned in TalkPointResponse
+TALK_POINT_RESPONSE_PROJECTION = {
+    "_id": 0,
+    "talk_point_id": 1,
+    "customer_name": 1,
+    "customer_persona": 1,
+    "deal_stage": 1,
+    "generated_content": 1,
+    "created_at": 1
+}
 
-async def generate_talk_points_with_rag(
+# Static prompt pieces for talk points generation
+TALK_POINTS_SYSTEM_PROMPT = """You are an expert sales strategist helping a salesperson prepare for an important customer call. Your task is to generate comprehensive, actionable talk points that will help them succeed.
+
+Your talk points should:
+1. Be specific and actionable
+2. Reference concrete features, benefits, and use cases from the provided information
+3. Be tailored to the customer's persona and deal stage
+4. Include potential objections and how to handle them
+5. Suggest questions to ask the customer
+6. Highlight key differentiators and value propositions
+7. Be organized in a clear, easy-to-reference format
+
+Format your response as a well-structured Markdown document with clear sections and bullet points."""
+
+TALK_POINTS_INSTRUCTIONS = """
+Please generate talk points that include:
+1. **Opening Strategy** - How to start the conversation
+2. **Key Messages** - Main points to communicate (with specific examples from the information)
+3. **Value Propositions** - Why they should choose your solution
+4. **Proof Points** - Specific features, capabilities, or benefits to highlight
+5. **Questions to Ask** - Discovery questions appropriate for this stage
+6. **Objection Handling** - Likely objections and how to address them
+7. **Next Steps** - How to advance the deal
+
+Make it specific, actionable, and reference concrete information from the provided context."""
+
+# Fully static, so it forms a prefix shared by every talk points request
+TALK_POINTS_SYSTEM_MESSAGE = f"{TALK_POINTS_SYSTEM_PROMPT}\n{TALK_POINTS_INSTRUCTIONS}"
+
+RETRIEVED_CONTEXT_HEADER = "\n\n=== PRODUCT/SERVICE INFORMATION ===\n"
+RETRIEVED_CONTEXT_FOOTER = "\n=== END INFORMATION ===\n"
+
+# RAG query used when the request has no persona, deal stage or context
+GENERIC_CONTEXT_QUERY = "product information and key features"
+
+
+async def prepare_talk_points_request(
     user_id: str,
     customer_name: str,
     customer_persona: str,
     deal_stage: str,
     context: str,
     db
-) -> str:
+) -> Dict[str, Any]:
     """
-    Generate talk points using RAG and OpenAI.
+    Resolve a talk points request from the cache or build its prompt using RAG.
     
     Args:
         user_id: User ID for RAG query
@@ -42,12 +93,26 @@ async def generate_talk_points_with_rag(
         db: Database connection
         
     Returns:
-        Generated talk points in Markdown format
+        Dictionary with "cached_content" set on a cache hit; otherwise the
+        chat "messages" plus the "cache_key", "embedding" and "chunk_ids"
+        needed to cache the generated talk points, and the "model" to use
     """
     try:
-        # Get user's company profile for context
-        user = await db.users.find_one({"user_id": user_id})
-        company_profile = user.get("company_profile", {}) if user else {}
+        # Premium users get the larger model; everyone else the faster default
+        tier = await talk_points_cache.get_user_tier(db, user_id)
+        model = (
+            settings.TALK_POINTS_MODEL_PREMIUM if tier == "premium"
+            else settings.TALK_POINTS_MODEL_DEFAULT
+        )
+        
+        # Serve identical requests straight from the cache
+        cache_key = talk_points_cache.build_cache_key(
+            user_id, customer_name, customer_persona, deal_stage, context, model
+        )
+        cached_talk_points = await talk_points_cache.lookup(db, cache_key)
+        if cached_talk_points is not None:
+            logger.info(f"Talk points cache hit for user {user_id}")
+            return {"cached_content": cached_talk_points}
         
         # Build query for RAG
         query_parts = []
@@ -58,91 +123,152 @@ async def generate_talk_points_with_rag(
         if context:
             query_parts.append(context)
         
-        query_text = " ".join(query_parts) if query_parts else "product information and key features"
-        
-        # Query RAG for relevant context
+        # Without request-specific inputs every generation retrieves the same
+        # generic chunks, so those are served from a periodically refreshed snapshot
         rag_service = get_rag_service(settings.OPENAI_API_KEY)
-        rag_results = await rag_service.query(
-            user_id=user_id,
-            query_text=query_text,
-            top_k=10  # Get more context for talk points
+        if query_parts:
+            rag_lookup = rag_service.query(
+                user_id=user_id,
+                query_text=" ".join(query_parts),
+                top_k=10  # Get more context for talk points
+            )
+        else:
+            rag_lookup = talk_points_cache.get_generic_context(
+                db,
+                rag_service,
+                user_id,
+                query_text=GENERIC_CONTEXT_QUERY,
+                top_k=10
+            )
+        
+        # Fetch the company profile, query RAG and embed the request concurrently;
+        # none of them depends on another
+        company_profile, rag_results, request_embedding = await asyncio.gather(
+            talk_points_cache.get_company_profile(db, user_id),
+            rag_lookup,
+            rag_service.embed_query(
+                talk_points_cache.build_semantic_text(customer_name, customer_persona, deal_stage, context)
+            )
         )
         
+        # Serve near-identical requests grounded on the same chunks from the cache
+        chunk_ids = [chunk["chunk_id"] for chunk in rag_results]
+        cached_talk_points = await talk_points_cache.lookup_similar(
+            db, user_id, customer_name, model, request_embedding, chunk_ids
+        )
+        if cached_talk_points is not None:
+            return {"cached_content": cached_talk_points}
+        
         # Build context from RAG results
         retrieved_context = ""
         if rag_results:
-            retrieved_context = "\n\n=== PRODUCT/SERVICE INFORMATION ===\n"
-            for i, chunk in enumerate(rag_results, 1):
-                retrieved_context += f"\n[Source {i}]\n{chunk['text']}\n"
-            retrieved_context += "\n=== END INFORMATION ===\n"
+            context_parts = [RETRIEVED_CONTEXT_HEADER]
+            context_parts.extend(
+                f"\n[Source {i}]\n{chunk['text']}\n" for i, chunk in enumerate(rag_results, 1)
+            )
+            context_parts.append(RETRIEVED_CONTEXT_FOOTER)
+            retrieved_context = "".join(context_parts)
             logger.info(f"Retrieved {len(rag_results)} chunks for talk points generation")
         
-        # Build prompt for talk points generation
-        system_prompt = """You are an expert sales strategist helping a salesperson prepare for an important customer call. Your task is to generate comprehensive, actionable talk points that will help them succeed.
-
-Your talk points should:
-1. Be specific and actionable
-2. Reference concrete features, benefits, and use cases from the provided information
-3. Be tailored to the customer's persona and deal stage
-4. Include potential objections and how to handle them
-5. Suggest questions to ask the customer
-6. Highlight key differentiators and value propositions
-7. Be organized in a clear, easy-to-reference format
-
-Format your response as a well-structured Markdown document with clear sections and bullet points."""
-
-        user_prompt = f"""Generate comprehensive talk points for an upcoming sales call.
-
+        # Build prompt for talk points generation. Everything static lives in
+        # the system message and per-request details go last, ordered from
+        # most to least stable, so the provider's prompt prefix cache can hit.
+        prompt_parts = ["Generate comprehensive talk points for an upcoming sales call.\n\n**Your Company/Product:**\n"]
+        
+        if company_profile:
+            if company_profile.get('name'):
+                prompt_parts.append(f"- Name: {company_profile['name']}\n")
+            if company_profile.get('description'):
+                prompt_parts.append(f"- Description: {company_profile['description']}\n")
+            if company_profile.get('value_proposition'):
+                prompt_parts.append(f"- Value Proposition: {company_profile['value_proposition']}\n")
+        
+        prompt_parts.append(f"""
 **Customer Information:**
 - Company: {customer_name or 'Not specified'}
 - Persona: {customer_persona or 'Not specified'}
 - Deal Stage: {deal_stage or 'Not specified'}
 - Additional Context: {context or 'None'}
-
-**Your Company/Product:**
-"""
+""")
         
-        if company_profile:
-            if company_profile.get('name'):
-                user_prompt += f"- Name: {company_profile['name']}\n"
-            if company_profile.get('description'):
-                user_prompt += f"- Description: {company_profile['description']}\n"
-            if company_profile.get('value_proposition'):
-                user_prompt += f"- Value Proposition: {company_profile['value_proposition']}\n"
+        prompt_parts.append(f"\n{retrieved_context}\n")
+        user_prompt = "".join(prompt_parts)
         
-        user_prompt += f"\n{retrieved_context}\n"
+        return {
+            "cached_content": None,
+            "model": model,
+            "messages": [
+                {"role": "system", "content": TALK_POINTS_SYSTEM_MESSAGE},
+                {"role": "user", "content": user_prompt}
+            ],
+            "cache_key": cache_key,
+            "embedding": request_embedding,
+            "chunk_ids": chunk_ids
+        }
         
-        user_prompt += """
-Please generate talk points that include:
-1. **Opening Strategy** - How to start the conversation
-2. **Key Messages** - Main points to communicate (with specific examples from the information)
-3. **Value Propositions** - Why they should choose your solution
-4. **Proof Points** - Specific features, capabilities, or benefits to highlight
-5. **Questions to Ask** - Discovery questions appropriate for this stage
-6. **Objection Handling** - Likely objections and how to address them
-7. **Next Steps** - How to advance the deal
+    except Exception as e:
+        logger.error(f"Error preparing talk points request: {e}")
+        raise
 
-Make it specific, actionable, and reference concrete information from the provided context."""
 
+async def generate_talk_points_with_rag(
+    user_id: str,
+    customer_name: str,
+    customer_persona: str,
+    deal_stage: str,
+    context: str,
+    db
+) -> str:
+    """
+    Generate talk points using RAG and OpenAI.
+    
+    Args:
+        user_id: User ID for RAG query
+        customer_name: Target customer name
+        customer_persona: Customer persona/role
+        deal_stage: Current deal stage
+        context: Additional context
+        db: Database connection
+        
+    Returns:
+        Generated talk points in Markdown format
+    """
+    try:
+        talk_points_request = await prepare_talk_points_request(
+            user_id, customer_name, customer_persona, deal_stage, context, db
+        )
+        if talk_points_request["cached_content"] is not None:
+            return talk_points_request["cached_content"]
+        
         # Generate talk points using OpenAI
         response = await openai_service.client.chat.completions.create(
-            model=settings.OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
+            model=talk_points_request["model"],
+            messages=talk_points_request["messages"],
             temperature=0.7,
-            max_tokens=2000
+            max_tokens=settings.TALK_POINTS_MAX_TOKENS
         )
         
         talk_points = response.choices[0].message.content
         
         # Log token usage
         usage = response.usage
+        prompt_details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(prompt_details, "cached_tokens", None) or 0
         logger.info(
-            f"Talk points generated. Tokens used: "
+            f"Talk points generated with {talk_points_request['model']}. Tokens used: "
             f"{usage.total_tokens} (prompt: {usage.prompt_tokens}, "
-            f"completion: {usage.completion_tokens})"
+            f"cached prompt: {cached_tokens}, completion: {usage.completion_tokens})"
+        )
+        
+        await talk_points_cache.store(
+            db,
+            key=talk_points_request["cache_key"],
+            user_id=user_id,
+            customer_name=customer_name,
+            model=talk_points_request["model"],
+            embedding=talk_points_request["embedding"],
+            chunk_ids=talk_points_request["chunk_ids"],
+            content=talk_points
         )
         
         return talk_points
@@ -152,10 +278,67 @@ Make it specific, actionable, and reference concrete information from the provid
         raise
 
 
+async def save_streamed_talk_point(
+    talk_point_id: str,
+    user_id: str,
+    request: TalkPointCreate,
+    stream_result: Dict[str, Any],
+    talk_points_request: Dict[str, Any],
+    db
+):
+    """
+    Background task to persist talk points once streaming has finished.
+    
+    Truncated or failed streams are neither saved nor cached.
+    
+    Args:
+        talk_point_id: ID announced to the client for this talk point
+        user_id: User ID
+        request: Original talk points request
+        stream_result: Streamed "content_parts" and whether the stream "completed"
+        talk_points_request: Result of prepare_talk_points_request
+        db: Database connection
+    """
+    if not stream_result["completed"]:
+        logger.warning(f"Streamed talk points {talk_point_id} did not complete; not saving")
+        return
+    
+    try:
+        generated_content = "".join(stream_result["content_parts"])
+        
+        talk_point = TalkPointInDB(
+            talk_point_id=talk_point_id,
+            user_id=user_id,
+            customer_name=request.customer_name,
+            customer_persona=request.customer_persona,
+            deal_stage=request.deal_stage,
+            context=request.context,
+            generated_content=generated_content
+        )
+        await db.talk_points.insert_one(talk_point.model_dump())
+        
+        if talk_points_request["cached_content"] is None:
+            await talk_points_cache.store(
+                db,
+                key=talk_points_request["cache_key"],
+                user_id=user_id,
+                customer_name=request.customer_name or "",
+                model=talk_points_request["model"],
+                embedding=talk_points_request["embedding"],
+                chunk_ids=talk_points_request["chunk_ids"],
+                content=generated_content
+            )
+        
+        logger.info(f"Streamed talk points saved with ID {talk_point_id}")
+        
+    except Exception as e:
+        logger.error(f"Error saving streamed talk points {talk_point_id}: {e}")
+
+
 @router.post("/generate", response_model=TalkPointResponse, status_code=status.HTTP_201_CREATED)
 async def generate_talk_points(
     request: TalkPointCreate,
-    current_user: UserInDB = Depends(get_current_user),
+    current_user: dict = Depends(get_current_user),
     db = Depends(get_database)
 ):
     """
@@ -165,11 +348,11 @@ async def generate_talk_points(
     customized talk points based on customer persona and deal stage.
     """
     try:
-        logger.info(f"Generating talk points for user {current_user.user_id}")
+        logger.info(f"Generating talk points for user {current_user['user_id']}")
         
         # Generate talk points
         generated_content = await generate_talk_points_with_rag(
-            user_id=current_user.user_id,
+            user_id=current_user["user_id"],
             customer_name=request.customer_name or "",
             customer_persona=request.customer_persona or "",
             deal_stage=request.deal_stage or "",
@@ -178,10 +361,8 @@ async def generate_talk_points(
         )
         
         # Create talk point record
-        from uuid import uuid4
         talk_point = TalkPointInDB(
-            talk_point_id=str(uuid4()),
-            user_id=current_user.user_id,
+            user_id=current_user["user_id"],
             customer_name=request.customer_name,
             customer_persona=request.customer_persona,
             deal_stage=request.deal_stage,
@@ -211,38 +392,157 @@ async def generate_talk_points(
         )
 
 
-@router.get("", response_model=List[TalkPointResponse])
+@router.post("/generate/stream")
+async def generate_talk_points_stream(
+    request: TalkPointCreate,
+    background_tasks: BackgroundTasks,
+    current_user: dict = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """
+    Generate talk points and stream them as Server-Sent Events.
+    
+    Each event carries a {"delta": ...} chunk of Markdown as it is generated.
+    The final event is {"done": true, "talk_point_id": ...}; the talk point
+    is saved once the stream has finished. A stream that fails or is cut off
+    at the token limit ends with {"error": ...} instead and is not saved.
+    """
+    user_id = current_user["user_id"]
+    
+    try:
+        logger.info(f"Streaming talk points for user {user_id}")
+        
+        talk_points_request = await prepare_talk_points_request(
+            user_id=user_id,
+            customer_name=request.customer_name or "",
+            customer_persona=request.customer_persona or "",
+            deal_stage=request.deal_stage or "",
+            context=request.context or "",
+            db=db
+        )
+        
+        completion = None
+        if talk_points_request["cached_content"] is None:
+            completion = await openai_service.client.chat.completions.create(
+                model=talk_points_request["model"],
+                messages=talk_points_request["messages"],
+                temperature=0.7,
+                max_tokens=settings.TALK_POINTS_MAX_TOKENS,
+                stream=True
+            )
+        
+    except Exception as e:
+        logger.error(f"Error in generate_talk_points_stream endpoint: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to generate talk points: {str(e)}"
+        )
+    
+    talk_point_id = new_id()
+    stream_result: Dict[str, Any] = {"content_parts": [], "completed": False}
+    
+    async def event_stream():
+        content_parts = stream_result["content_parts"]
+        if completion is None:
+            content_parts.append(talk_points_request["cached_content"])
+            yield f"data: {json.dumps({'delta': talk_points_request['cached_content']})}\n\n"
+        else:
+            finish_reason = None
+            try:
+                async for chunk in completion:
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    finish_reason = getattr(choice, "finish_reason", None) or finish_reason
+                    delta = choice.delta.content
+                    if delta:
+                        content_parts.append(delta)
+                        yield f"data: {json.dumps({'delta': delta})}\n\n"
+            except Exception as e:
+                logger.error(f"Error streaming talk points {talk_point_id}: {e}")
+                yield f"data: {json.dumps({'error': 'Failed to generate talk points'})}\n\n"
+                return
+            
+            # Output cut off at max_tokens is incomplete
+            if finish_reason == "length":
+                logger.warning(f"Streamed talk points {talk_point_id} hit the token limit")
+                yield f"data: {json.dumps({'error': 'Talk points were truncated at the token limit'})}\n\n"
+                return
+        
+        stream_result["completed"] = True
+        yield f"data: {json.dumps({'done': True, 'talk_point_id': talk_point_id})}\n\n"
+    
+    # Runs after the last event has been sent
+    background_tasks.add_task(
+        save_streamed_talk_point,
+        talk_point_id,
+        user_id,
+        request,
+        stream_result,
+        talk_points_request,
+        db
+    )
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        background=background_tasks
+    )
+
+
+@router.get("", response_model=TalkPointListResponse)
 async def list_talk_points(
     limit: int = Query(20, ge=1, le=100, description="Number of talk points to return"),
-    offset: int = Query(0, ge=0, description="Number of talk points to skip"),
-    current_user: UserInDB = Depends(get_current_user),
+    skip: int = Query(0, ge=0, description="Number of talk points to skip"),
+    current_user: dict = Depends(get_current_user),
     db = Depends(get_database)
 ):
     """
     List all talk points generated by the current user.
     
-    Returns talk points in reverse chronological order (newest first).
+    Returns talk points in reverse chronological order (newest first),
+    together with the total count for pagination.
     """
     try:
-        # Get talk points for user
-        cursor = db.talk_points.find(
-            {"user_id": current_user.user_id}
-        ).sort("created_at", -1).skip(offset).limit(limit)
-        
-        talk_points = []
-        async for tp in cursor:
-            talk_points.append(TalkPointResponse(
+        # Fetch the page and the total count in a single aggregation
+        pipeline = [
+            {"$match": {"user_id": current_user["user_id"]}},
+            {
+                "$facet": {
+                    "items": [
+                        {"$sort": {"created_at": -1}},
+                        {"$skip": skip},
+                        {"$limit": limit},
+                        {"$project": TALK_POINT_RESPONSE_PROJECTION}
+                    ],
+                    "total": [{"$count": "count"}]
+                }
+            }
+        ]
+        results = await db.talk_points.aggregate(pipeline).to_list(length=1)
+        facets = results[0] if results else {"items": [], "total": []}
+        
+        talk_points = [
+            TalkPointResponse(
                 talk_point_id=tp["talk_point_id"],
                 customer_name=tp.get("customer_name"),
                 customer_persona=tp.get("customer_persona"),
                 deal_stage=tp.get("deal_stage"),
                 generated_content=tp["generated_content"],
                 created_at=tp["created_at"]
-            ))
+            )
+            for tp in facets["items"]
+        ]
+        total = facets["total"][0]["count"] if facets["total"] else 0
         
-        logger.info(f"Retrieved {len(talk_points)} talk points for user {current_user.user_id}")
+        logger.info(f"Retrieved {len(talk_points)} talk points for user {current_user['user_id']}")
         
-        return talk_points
+        return TalkPointListResponse(
+            talk_points=talk_points,
+            total=total,
+            limit=limit,
+            skip=skip
+        )
         
     except Exception as e:
         logger.error(f"Error listing talk points: {e}")
@@ -255,17 +555,20 @@ async def list_talk_points(
 @router.get("/{talk_point_id}", response_model=TalkPointResponse)
 async def get_talk_point(
     talk_point_id: str,
-    current_user: UserInDB = Depends(get_current_user),
+    current_user: dict = Depends(get_current_user),
     db = Depends(get_database)
 ):
     """
     Get a specific talk point by ID.
     """
     try:
-        talk_point = await db.talk_points.find_one({
-            "talk_point_id": talk_point_id,
-            "user_id": current_user.user_id
-        })
+        talk_point = await db.talk_points.find_one(
+            {
+                "talk_point_id": talk_point_id,
+                "user_id": current_user["user_id"]
+            },
+            TALK_POINT_RESPONSE_PROJECTION
+        )
         
         if not talk_point:
             raise HTTPException(
@@ -295,7 +598,7 @@ async def get_talk_point(
 @router.delete("/{talk_point_id}", status_code=status.HTTP_200_OK)
 async def delete_talk_point(
     talk_point_id: str,
-    current_user: UserInDB = Depends(get_current_user),
+    current_user: dict = Depends(get_current_user),
     db = Depends(get_database)
 ):
     """
@@ -304,7 +607,7 @@ async def delete_talk_point(
     try:
         result = await db.talk_points.delete_one({
             "talk_point_id": talk_point_id,
-            "user_id": current_user.user_id
+            "user_id": current_user["user_id"]
         })
         
         if result.deleted_count == 0:
@@ -3,9 +3,11 @@ User profile management endpoints.
 """
 from fastapi import APIRouter, HTTPException, status, Depends
 from app.models.user import UserProfileUpdate, PasswordChange, AccountDeletion, UserResponse
-from app.core.security import hash_password, verify_password
+from app.core.security import ahash_password, averify_password
 from app.core.dependencies import get_current_user
 from app.db.mongodb import get_database
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 from datetime import datetime
 import logging
 
@@ -13,6 +15,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# Fields returned in UserResponse
+USER_PROFILE_PROJECTION = {"_id": 0, "user_id": 1, "email": 1, "name": 1, "activation_state": 1}
+
 
 @router.get("/profile", response_model=UserResponse)
 async def get_user_profile(current_user: dict = Depends(get_current_user)):
@@ -31,7 +36,7 @@ async def get_user_profile(current_user: dict = Depends(get_current_user)):
         )
     
     # Fetch user from database
-    user = await db.users.find_one({"user_id": current_user["user_id"]})
+    user = await db.users.find_one({"user_id": current_user["user_id"]}, USER_PROFILE_PROJECTION)
     
     if not user:
         raise HTTPException(
@@ -43,7 +48,7 @@ async def get_user_profile(current_user: dict = Depends(get_current_user)):
         user_id=user["user_id"],
         email=user["email"],
         name=user.get("name"),
-        activation_state=user["activation_state"]
+        activation_state=user.get("activation_state")
     )
 
 
@@ -58,7 +63,7 @@ async def update_user_profile(
     - Requires valid JWT token
     - Accepts partial updates (name and/or email)
     - Validates email format if provided
-    - Checks for duplicate email if email is being changed
+    - Rejects emails already used by another account
     - Returns updated user profile
     """
     db = get_database()
@@ -76,18 +81,8 @@ async def update_user_profile(
         update_data["name"] = profile_data.name
     
     if profile_data.email is not None:
-        # Check if email is being changed
-        current_user_doc = await db.users.find_one({"user_id": current_user["user_id"]})
-        
-        if current_user_doc and current_user_doc["email"] != profile_data.email:
-            # Check if new email already exists
-            existing_user = await db.users.find_one({"email": profile_data.email})
-            if existing_user:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already in use by another account"
-                )
-            update_data["email"] = profile_data.email
+        # Uniqueness is enforced by the unique index on email
+        update_data["email"] = profile_data.email
     
     # If no fields to update, return current profile
     if not update_data:
@@ -96,14 +91,16 @@ async def update_user_profile(
     # Update last_active_at timestamp
     update_data["last_active_at"] = datetime.utcnow()
     
-    # Update user in database
+    # Update user and fetch the result in one round-trip
     try:
-        result = await db.users.update_one(
+        updated_user = await db.users.find_one_and_update(
             {"user_id": current_user["user_id"]},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection=USER_PROFILE_PROJECTION,
+            return_document=ReturnDocument.AFTER
         )
         
-        if result.matched_count == 0:
+        if updated_user is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
@@ -112,6 +109,11 @@ async def update_user_profile(
         logger.info(f"User profile updated: {current_user['user_id']}")
     except HTTPException:
         raise
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already in use by another account"
+        )
     except Exception as e:
         logger.error(f"Error updating user profile: {e}")
         raise HTTPException(
@@ -119,14 +121,11 @@ async def update_user_profile(
             detail="Failed to update profile"
         )
     
-    # Fetch and return updated user
-    updated_user = await db.users.find_one({"user_id": current_user["user_id"]})
-    
     return UserResponse(
         user_id=updated_user["user_id"],
         email=updated_user["email"],
         name=updated_user.get("name"),
-        activation_state=updated_user["activation_state"]
+        activation_state=updated_user.get("activation_state")
     )
 
 
@@ -152,8 +151,8 @@ async def change_password(
             detail="Database connection not available"
         )
     
-    # Fetch user from database
-    user = await db.users.find_one({"user_id": current_user["user_id"]})
+    # Fetch only the password hash needed for verification
+    user = await db.users.find_one({"user_id": current_user["user_id"]}, {"password_hash": 1, "_id": 0})
     
     if not user:
         raise HTTPException(
@@ -162,14 +161,14 @@ async def change_password(
         )
     
     # Verify old password
-    if not verify_password(password_data.old_password, user["password_hash"]):
+    if not await averify_password(password_data.old_password, user["password_hash"]):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
         )
     
     # Hash new password
-    new_password_hash = hash_password(password_data.new_password)
+    new_password_hash = await ahash_password(password_data.new_password)
     
     # Update password in database
     try:
@@ -217,8 +216,8 @@ async def delete_account(
             detail="Database connection not available"
         )
     
-    # Fetch user from database
-    user = await db.users.find_one({"user_id": current_user["user_id"]})
+    # Fetch only the password hash needed for verification
+    user = await db.users.find_one({"user_id": current_user["user_id"]}, {"password_hash": 1, "_id": 0})
     
     if not user:
         raise HTTPException(
@@ -227,7 +226,7 @@ async def delete_account(
         )
     
     # Verify password
-    if not verify_password(deletion_data.password, user["password_hash"]):
+    if not await averify_password(deletion_data.password, user["password_hash"]):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Password is incorrect"
@@ -2,8 +2,9 @@
 Configuration module using Pydantic Settings.
 Loads environment variables from .env file.
 """
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import Any, Tuple
 
 
 class Settings(BaseSettings):
@@ -15,6 +16,13 @@ class Settings(BaseSettings):
     
     # Database settings
     MONGODB_URI: str
+    MONGODB_MAX_POOL_SIZE: int = 200
+    MONGODB_MIN_POOL_SIZE: int = 10
+    MONGODB_MAX_IDLE_TIME_MS: int = 300_000
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = 5000
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 5000
+    MONGODB_COMPRESSORS: str = "zstd,snappy,zlib"
+    MONGODB_ZLIB_COMPRESSION_LEVEL: int = 6
     
     # Authentication settings
     JWT_SECRET: str = "your-secret-key-change-in-production"
@@ -27,18 +35,42 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = "gpt-4"
     
+    # Talk points generation: standard users get the faster, cheaper model
+    TALK_POINTS_MODEL_DEFAULT: str = "gpt-4o-mini"
+    TALK_POINTS_MODEL_PREMIUM: str = "gpt-4o"
+    TALK_POINTS_MAX_TOKENS: int = 1200
+    TALK_POINTS_CACHE_TTL_SECONDS: int = 86400
+    OPENAI_MAX_CONNECTIONS: int = 100
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = 50
+    
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=True
     )
     
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """Convert CORS_ORIGINS string to list. Supports wildcard '*' for production."""
+    _cors_origins_list: Tuple[str, ...] = PrivateAttr(default=())
+    
+    def model_post_init(self, __context: Any) -> None:
+        """
+        Parse CORS_ORIGINS once. Supports wildcard '*' for production.
+        
+        Origins are normalized the way browsers send them (lowercase, no
+        trailing slash), since the CORS middleware compares them exactly.
+        """
         if self.CORS_ORIGINS == "*":
-            return ["*"]
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+            self._cors_origins_list = ("*",)
+        else:
+            self._cors_origins_list = tuple(
+                origin.strip().lower().rstrip("/")
+                for origin in self.CORS_ORIGINS.split(",")
+                if origin.strip()
+            )
+    
+    @property
+    def cors_origins_list(self) -> Tuple[str, ...]:
+        """CORS_ORIGINS as a tuple of origins, parsed at startup."""
+        return self._cors_origins_list
     
     @property
     def is_production(self) -> bool:
@@ -1,7 +1,7 @@
 """
 FastAPI dependencies for authentication and authorization.
 """
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
 from app.core.security import decode_access_token
@@ -15,12 +15,17 @@ security = HTTPBearer()
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> dict:
     """
     Dependency to extract and validate the current user from JWT token.
     
+    The decoded user is cached on ``request.state.user`` so any other code
+    handling the same request can reuse it without decoding the token again.
+    
     Args:
+        request: Incoming request (used for per-request caching)
         credentials: HTTP Bearer token credentials
         
     Returns:
@@ -29,6 +34,10 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or expired
     """
+    cached_user = getattr(request.state, "user", None)
+    if cached_user is not None:
+        return cached_user
+    
     token = credentials.credentials
     
     # Decode and validate token
@@ -50,10 +59,26 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return {
+    current_user = {
         "user_id": user_id,
         "email": payload.get("email")
     }
+    request.state.user = current_user
+    
+    return current_user
+
+
+async def get_current_user_id(current_user: dict = Depends(get_current_user)) -> str:
+    """
+    Lightweight dependency returning only the authenticated user's ID.
+    
+    Args:
+        current_user: Current authenticated user (cached per request)
+        
+    Returns:
+        The user_id string, ready to drop into MongoDB filters
+    """
+    return current_user["user_id"]
 
 
 async def get_current_user_optional(
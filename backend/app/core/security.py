@@ -1,22 +1,38 @@
 """
 Security utilities for password hashing and JWT token management.
 """
-from passlib.context import CryptContext
-from jose import JWTError, jwt
-from datetime import datetime, timedelta
+import asyncio
+import time
+import bcrypt
+from cachetools import TTLCache
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+import jwt
+from jwt import PyJWTError
+from datetime import timedelta
 from typing import Optional, Dict
 from app.core.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Password hashing context supporting both bcrypt (new) and argon2 (legacy)
-# This allows old passwords hashed with argon2 to still work while new passwords use bcrypt
-pwd_context = CryptContext(schemes=["bcrypt", "argon2"], deprecated="auto")
+# New passwords are hashed with Argon2 using the library's recommended defaults.
+# Existing bcrypt hashes are still verified so those users can keep logging in,
+# and are replaced with Argon2 hashes on their next login.
+password_hasher = PasswordHasher()
+
+# bcrypt only looks at the first 72 bytes of a password
+BCRYPT_MAX_PASSWORD_BYTES = 72
 
 # JWT settings
 ALGORITHM = "HS256"
 
+# Recently verified tokens, so bursts of requests with the same token are
+# only verified once. Entries live at most TOKEN_CACHE_TTL seconds and tokens
+# that expire sooner than that are never cached.
+TOKEN_CACHE_TTL = 60
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL)
+
 
 def hash_password(password: str) -> str:
     """
@@ -28,7 +44,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -43,12 +59,66 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         True if password matches, False otherwise
     """
     try:
-        return pwd_context.verify(plain_password, hashed_password)
+        if hashed_password.startswith("$argon2"):
+            return password_hasher.verify(hashed_password, plain_password)
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES],
+            hashed_password.encode("utf-8")
+        )
+    except (VerificationError, InvalidHashError):
+        return False
     except Exception as e:
         logger.error(f"Password verification error: {e}")
         return False
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a verified password hash should be replaced.
+    
+    Args:
+        hashed_password: Stored hash that the password was just verified against
+        
+    Returns:
+        True for bcrypt hashes and Argon2 hashes made with other parameters
+    """
+    if not hashed_password.startswith("$argon2"):
+        return True
+    try:
+        return password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
+
+
+async def ahash_password(password: str) -> str:
+    """
+    Hash a password in a worker thread so the event loop isn't blocked.
+    
+    Args:
+        password: Plain text password to hash
+        
+    Returns:
+        Hashed password string
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, hash_password, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in a worker thread so the event loop isn't blocked.
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to compare against
+        
+    Returns:
+        True if password matches, False otherwise
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, verify_password, plain_password, hashed_password
+    )
+
+
 def create_access_token(data: Dict[str, str], expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
@@ -62,10 +132,11 @@ def create_access_token(data: Dict[str, str], expires_delta: Optional[timedelta]
     """
     to_encode = data.copy()
     
+    # exp is a plain epoch timestamp, so no datetime conversion is needed
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time() + expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(seconds=settings.JWT_EXPIRES_IN)
+        expire = int(time.time()) + settings.JWT_EXPIRES_IN
     
     to_encode.update({"exp": expire})
     
@@ -83,10 +154,16 @@ def decode_access_token(token: str) -> Optional[Dict[str, str]]:
     Returns:
         Dictionary containing token payload if valid, None otherwise
     """
+    cached_payload = _token_cache.get(token)
+    if cached_payload is not None:
+        return cached_payload
+    
     try:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[ALGORITHM])
+        if payload.get("exp", 0) > time.time() + TOKEN_CACHE_TTL:
+            _token_cache[token] = payload
         return payload
-    except JWTError as e:
+    except PyJWTError as e:
         logger.error(f"JWT decode error: {e}")
         return None
     except Exception as e:
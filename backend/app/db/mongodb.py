@@ -2,7 +2,12 @@
 MongoDB connection module using Motor (async driver).
 Handles database connection lifecycle.
 """
+import asyncio
+import time
+from functools import lru_cache
+from typing import Tuple
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import IndexModel
 from app.core.config import settings
 import logging
 
@@ -12,6 +17,11 @@ logger = logging.getLogger(__name__)
 mongodb_client: AsyncIOMotorClient = None
 database = None
 
+# Result of the last ping as (time.monotonic() timestamp, connected), reused
+# for PING_CACHE_TTL seconds so frequent health probes don't each hit the server
+PING_CACHE_TTL = 2.0
+_last_ping: Tuple[float, bool] = (0.0, False)
+
 
 async def connect_to_mongo():
     """
@@ -20,14 +30,28 @@ async def connect_to_mongo():
     """
     global mongodb_client, database
     
+    get_collection.cache_clear()
+    
     try:
         logger.info("Connecting to MongoDB...")
-        mongodb_client = AsyncIOMotorClient(settings.MONGODB_URI)
+        mongodb_client = AsyncIOMotorClient(
+            settings.MONGODB_URI,
+            appname="prapp",
+            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+            maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+            waitQueueTimeoutMS=settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+            serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+            retryWrites=True,
+            compressors=settings.MONGODB_COMPRESSORS,
+            zlibCompressionLevel=settings.MONGODB_ZLIB_COMPRESSION_LEVEL
+        )
         database = mongodb_client.get_default_database()
         
         # Test the connection
         await mongodb_client.admin.command('ping')
         logger.info("Connected to MongoDB successfully")
+        log_compression()
         
         # Create indexes
         await create_indexes()
@@ -38,6 +62,20 @@ async def connect_to_mongo():
         # Don't raise - allow server to start without DB
 
 
+def log_compression():
+    """
+    Log the wire compressors configured in MONGODB_COMPRESSORS.
+    The server picks the first one it supports; compressors whose Python
+    package isn't installed are dropped by the driver before negotiation.
+    """
+    compressors = [c.strip() for c in settings.MONGODB_COMPRESSORS.split(",") if c.strip()]
+    
+    if compressors:
+        logger.info(f"MongoDB wire compression configured: {', '.join(compressors)}")
+    else:
+        logger.info("MongoDB wire compression disabled by configuration")
+
+
 async def close_mongo_connection():
     """
     Close MongoDB connection.
@@ -48,22 +86,35 @@ async def close_mongo_connection():
     if mongodb_client:
         logger.info("Closing MongoDB connection...")
         mongodb_client.close()
+        get_collection.cache_clear()
         logger.info("MongoDB connection closed")
 
 
 async def ping_db() -> bool:
     """
     Test MongoDB connectivity by sending a ping command.
+    The result is cached for PING_CACHE_TTL seconds.
     Returns True if connection is successful, False otherwise.
     """
+    global _last_ping
+    
+    checked_at, connected = _last_ping
+    now = time.monotonic()
+    if checked_at and now - checked_at < PING_CACHE_TTL:
+        return connected
+    
     try:
         if mongodb_client:
             await mongodb_client.admin.command('ping')
-            return True
-        return False
+            connected = True
+        else:
+            connected = False
     except Exception as e:
         logger.error(f"MongoDB ping failed: {e}")
-        return False
+        connected = False
+    
+    _last_ping = (now, connected)
+    return connected
 
 
 def get_database():
@@ -74,6 +125,15 @@ def get_database():
     return database
 
 
+@lru_cache(maxsize=32)
+def get_collection(name: str):
+    """
+    Get a collection from the database instance.
+    Handles are cached so routes don't build a new collection object per request.
+    """
+    return database[name]
+
+
 async def create_indexes():
     """
     Create MongoDB indexes for efficient queries.
@@ -83,64 +143,98 @@ async def create_indexes():
         logger.warning("Database not available, skipping index creation")
         return
     
-    try:
-        logger.info("Creating MongoDB indexes...")
-        
-        # Helper function to create index if it doesn't exist
-        async def ensure_index(collection, keys, **kwargs):
-            try:
-                await collection.create_index(keys, **kwargs)
-            except Exception as e:
-                # Index might already exist, which is fine
-                if "already exists" in str(e) or "IndexKeySpecsConflict" in str(e):
-                    logger.debug(f"Index already exists: {keys}")
-                else:
-                    raise
-        
-        # Users collection indexes
-        await ensure_index(database.users, "user_id", unique=True)
-        await ensure_index(database.users, "email", unique=True, sparse=True)
-        logger.info("Ensured indexes for users collection")
-        
-        # PRDs collection indexes
-        await ensure_index(database.prds, "prd_id", unique=True)
-        await ensure_index(database.prds, "user_id")
-        await ensure_index(database.prds, [("user_id", 1), ("status", 1)])
-        await ensure_index(database.prds, [("user_id", 1), ("created_at", -1)])
-        await ensure_index(database.prds, [("user_id", 1), ("updated_at", -1)])
-        logger.info("Ensured indexes for prds collection")
-        
-        # Evaluations collection indexes
-        await ensure_index(database.evaluations, "evaluation_id", unique=True)
-        await ensure_index(database.evaluations, "prd_id", unique=True)
-        await ensure_index(database.evaluations, "user_id")
-        await ensure_index(database.evaluations, [("user_id", 1), ("created_at", -1)])
-        await ensure_index(database.evaluations, [("user_id", 1), ("overall_score", -1)])
-        logger.info("Ensured indexes for evaluations collection")
-        
-        # Sessions collection indexes
-        await ensure_index(database.sessions, "session_id", unique=True)
-        await ensure_index(database.sessions, "user_id")
-        await ensure_index(database.sessions, [("user_id", 1), ("status", 1)])
-        await ensure_index(database.sessions, [("user_id", 1), ("created_at", -1)])
-        await ensure_index(database.sessions, [("user_id", 1), ("preparation_type", 1)])
-        logger.info("Ensured indexes for sessions collection")
-        
-        # Session evaluations collection indexes
-        await ensure_index(database.session_evaluations, "evaluation_id", unique=True)
-        await ensure_index(database.session_evaluations, "session_id", unique=True)
-        await ensure_index(database.session_evaluations, "user_id")
-        await ensure_index(database.session_evaluations, [("user_id", 1), ("created_at", -1)])
-        await ensure_index(database.session_evaluations, [("user_id", 1), ("overall_score", -1)])
-        logger.info("Ensured indexes for session_evaluations collection")
-        
-        # Additional indexes for analytics queries
-        await ensure_index(database.prds, [("user_id", 1), ("status", 1), ("created_at", -1)])
-        await ensure_index(database.prds, [("title", "text"), ("description", "text")])
-        logger.info("Ensured text search indexes for prds collection")
-        
-        logger.info("All indexes ensured successfully")
+    logger.info("Creating MongoDB indexes...")
+    
+    # Compare the wanted indexes with the existing ones locally, by name and
+    # by key pattern, and only send the missing ones in a single createIndexes
+    # command; an up-to-date collection costs just one listIndexes round trip
+    async def ensure_indexes(collection, indexes):
+        existing_names = set()
+        existing_keys = set()
+        async for index in collection.list_indexes():
+            existing_names.add(index["name"])
+            existing_keys.add(tuple(index["key"].items()))
         
-    except Exception as e:
-        logger.error(f"Error creating indexes: {e}")
-        # Don't raise - allow server to continue even if index creation fails
\ No newline at end of file
+        missing = [
+            index for index in indexes
+            if index.document["name"] not in existing_names
+            and tuple(index.document["key"].items()) not in existing_keys
+        ]
+        if missing:
+            await collection.create_indexes(missing)
+            logger.debug("Created %d indexes for %s collection", len(missing), collection.name)
+        return len(missing)
+    
+    indexes_by_collection = [
+        # Single-field user_id indexes are left out wherever a compound index
+        # starts with user_id, since that index serves the same queries
+        (database.users, [
+            IndexModel("user_id", unique=True),
+            IndexModel("email", unique=True, sparse=True),
+            # Only users with a pending password reset have a token
+            IndexModel("reset_token", sparse=True),
+        ]),
+        (database.prds, [
+            IndexModel("prd_id", unique=True),
+            IndexModel([("user_id", 1), ("created_at", -1)]),
+            IndexModel([("user_id", 1), ("updated_at", -1)]),
+            # Analytics queries and text search
+            IndexModel([("user_id", 1), ("status", 1), ("created_at", -1)]),
+            IndexModel([("title", "text"), ("description", "text")]),
+        ]),
+        (database.evaluations, [
+            IndexModel("evaluation_id", unique=True),
+            IndexModel("prd_id", unique=True),
+            IndexModel([("user_id", 1), ("created_at", -1)]),
+            IndexModel([("user_id", 1), ("overall_score", -1)]),
+        ]),
+        (database.sessions, [
+            IndexModel("session_id", unique=True),
+            IndexModel([("user_id", 1), ("status", 1)]),
+            IndexModel([("user_id", 1), ("created_at", -1)]),
+            IndexModel([("user_id", 1), ("preparation_type", 1)]),
+        ]),
+        (database.session_evaluations, [
+            IndexModel("evaluation_id", unique=True),
+            IndexModel("session_id", unique=True),
+            IndexModel([("user_id", 1), ("created_at", -1)]),
+            IndexModel([("user_id", 1), ("overall_score", -1)]),
+        ]),
+        (database.talk_points, [
+            IndexModel([("talk_point_id", 1), ("user_id", 1)], unique=True),
+            IndexModel([("user_id", 1), ("created_at", -1)]),
+        ]),
+        (database.documents, [
+            IndexModel("document_id", unique=True),
+            IndexModel([("user_id", 1), ("upload_date", -1)]),
+        ]),
+        (database.playbooks, [
+            IndexModel("id", unique=True),
+            IndexModel([("user_id", 1), ("updated_at", -1)]),
+        ]),
+        (database.talk_point_cache, [
+            # Entries expire after TALK_POINTS_CACHE_TTL_SECONDS (a day by default)
+            IndexModel("createdAt", expireAfterSeconds=settings.TALK_POINTS_CACHE_TTL_SECONDS),
+            IndexModel([("user_id", 1), ("customer_name", 1), ("model", 1), ("createdAt", -1)]),
+        ]),
+    ]
+    
+    # Collections are independent, so create their indexes concurrently
+    results = await asyncio.gather(
+        *(ensure_indexes(collection, indexes) for collection, indexes in indexes_by_collection),
+        return_exceptions=True
+    )
+    
+    created = 0
+    failed = 0
+    for (collection, _), result in zip(indexes_by_collection, results):
+        if isinstance(result, Exception):
+            # Don't raise - allow server to continue even if index creation fails
+            failed += 1
+            logger.error(f"Error creating indexes for {collection.name} collection: {result}")
+        else:
+            created += result
+    
+    ensured = len(indexes_by_collection) - failed
+    logger.info(f"Indexes ensured for {ensured} collections ({created} created, {failed} failed)")
+
@@ -3,8 +3,10 @@ FastAPI application entry point for Interview OS (prapp) backend.
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from app.db.mongodb import connect_to_mongo, close_mongo_connection
+from app.services.openai_service import close_openai_client
 import logging
 
 # Configure logging
@@ -24,13 +26,15 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application...")
     await close_mongo_connection()
+    await close_openai_client()
 
 
 app = FastAPI(
     title="Sales Call Prep API",
     description="Backend API for Sales Call Preparation platform with AI-powered features",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS middleware
@@ -85,4 +89,4 @@ from app.api.analytics import router as analytics_router
 api_v1_router.include_router(analytics_router)
 
 # Mount API v1 router
-app.include_router(api_v1_router)
\ No newline at end of file
+app.include_router(api_v1_router)
@@ -0,0 +1,41 @@
+"""
+TypeAdapter registry for validating and serializing models on hot routes.
+"""
+from pydantic import TypeAdapter
+from app.models.playbook import ContentSection, PlaybookInDB, PlaybookResponse, Scenario
+from app.models.prd import PRDInDB, PRDResponse
+from app.models.session import (
+    ChatMessage,
+    SendMessageResponse,
+    SessionDetailResponse,
+    SessionInDB,
+    SessionResponse,
+)
+
+_REGISTRY: dict[type, TypeAdapter] = {}
+
+
+def adapter_for(cls: type) -> TypeAdapter:
+    """
+    Get the shared TypeAdapter for a model, building it on first use.
+    
+    Args:
+        cls: Model class (or any type) to validate against
+        
+    Returns:
+        Cached TypeAdapter for the type
+    """
+    adapter = _REGISTRY.get(cls)
+    if adapter is None:
+        adapter = _REGISTRY[cls] = TypeAdapter(cls)
+    return adapter
+
+
+# Models read back from MongoDB or returned by hot routes are registered at import
+for _model in (
+    PlaybookInDB, PlaybookResponse, Scenario, ContentSection,
+    PRDInDB, PRDResponse,
+    SessionInDB, SessionResponse, SessionDetailResponse, ChatMessage,
+    SendMessageResponse,
+):
+    adapter_for(_model)
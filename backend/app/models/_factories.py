@@ -0,0 +1,59 @@
+"""
+Default factories shared by the Pydantic models.
+"""
+from datetime import datetime
+import os
+import secrets
+import threading
+import time
+
+# Random bytes for new_uuid are read from the OS in blocks, so creating many
+# IDs at once (e.g. the scenarios of a generated playbook) costs one urandom call
+UUID_POOL_SIZE = 4096
+_uuid_pool = threading.local()
+
+# A forked worker must not hand out the same IDs as its parent
+os.register_at_fork(after_in_child=lambda: _uuid_pool.__dict__.clear())
+
+# utcnow reuses its last result for UTCNOW_TICK_NS, so models built in the
+# same burst (e.g. a user and an AI message) share one datetime object
+UTCNOW_TICK_NS = 1_000_000
+_last_now: tuple = (0, None)
+
+
+def new_id() -> str:
+    """Random 128-bit identifier as a 32-character hex string."""
+    return secrets.token_hex(16)
+
+
+def new_uuid() -> str:
+    """Random version 4 UUID in its canonical hyphenated form."""
+    pool = getattr(_uuid_pool, "bytes", None)
+    offset = getattr(_uuid_pool, "offset", UUID_POOL_SIZE)
+    if pool is None or offset >= UUID_POOL_SIZE:
+        pool = _uuid_pool.bytes = os.urandom(UUID_POOL_SIZE)
+        offset = 0
+    _uuid_pool.offset = offset + 16
+    
+    raw = bytearray(pool[offset:offset + 16])
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def utcnow() -> datetime:
+    """
+    Current UTC time as a naive datetime, reused for up to a millisecond.
+    
+    Naive like the datetime.utcnow() values the routes write, and like the
+    values the (non tz_aware) Motor client reads back.
+    """
+    global _last_now
+    
+    ticked_at, now = _last_now
+    ns = time.monotonic_ns()
+    if now is None or ns - ticked_at >= UTCNOW_TICK_NS:
+        now = datetime.utcnow()
+        _last_now = (ns, now)
+    return now
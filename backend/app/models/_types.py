@@ -0,0 +1,14 @@
+"""
+Constrained string types shared by the request models.
+"""
+from typing import Annotated
+from pydantic import StringConstraints
+
+# Titles of playbooks, scenarios and PRDs
+Title = Annotated[str, StringConstraints(min_length=1, max_length=200, strip_whitespace=True)]
+
+# Free-form text fields (descriptions, meeting context, agendas)
+LongText = Annotated[str, StringConstraints(max_length=20_000, strip_whitespace=True)]
+
+# New passwords; the upper bound keeps hashing cost bounded
+Password = Annotated[str, StringConstraints(min_length=8, max_length=128)]
@@ -1,7 +1,7 @@
 """
 AI-related models for PRD generation and enhancement.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 
 
@@ -14,12 +14,13 @@ class PRDGenerateRequest(BaseModel):
         description="Description of the product idea to generate a PRD for"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "idea_description": "A mobile app that helps users track their daily water intake with reminders and gamification features. Users can set goals, earn badges, and compete with friends."
             }
         }
+    )
 
 
 class PRDEnhanceRequest(BaseModel):
@@ -31,12 +32,13 @@ class PRDEnhanceRequest(BaseModel):
         description="Instructions for how to enhance the PRD"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "enhancement_instructions": "Add more specific success metrics with numerical targets and expand the timeline to include development phases."
             }
         }
+    )
 
 
 class AIGeneratedPRD(BaseModel):
@@ -48,8 +50,8 @@ class AIGeneratedPRD(BaseModel):
     timeline: str = Field(..., description="Generated timeline")
     tokens_used: Optional[int] = Field(None, description="Number of tokens used in generation")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Water Intake Tracking Mobile App",
                 "description": "A comprehensive mobile application designed to help users maintain optimal hydration levels through intelligent tracking, personalized reminders, and engaging gamification features. The app addresses the common problem of inadequate water consumption by making hydration tracking fun and social.",
@@ -64,6 +66,7 @@ class AIGeneratedPRD(BaseModel):
                 "tokens_used": 1250
             }
         }
+    )
 
 
 class PRDGenerateResponse(BaseModel):
@@ -71,8 +74,8 @@ class PRDGenerateResponse(BaseModel):
     message: str = Field(..., description="Success message")
     generated_prd: AIGeneratedPRD = Field(..., description="The generated PRD content")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "message": "PRD generated successfully",
                 "generated_prd": {
@@ -85,6 +88,7 @@ class PRDGenerateResponse(BaseModel):
                 }
             }
         }
+    )
 
 
 class PRDEnhanceResponse(BaseModel):
@@ -92,8 +96,8 @@ class PRDEnhanceResponse(BaseModel):
     message: str = Field(..., description="Success message")
     enhanced_prd: AIGeneratedPRD = Field(..., description="The enhanced PRD content")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "message": "PRD enhanced successfully",
                 "enhanced_prd": {
@@ -105,4 +109,5 @@ class PRDEnhanceResponse(BaseModel):
                     "tokens_used": 1450
                 }
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
@@ -2,11 +2,37 @@
 Document models for knowledge base management.
 Handles document uploads, indexing, and metadata.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
-from uuid import uuid4
 from enum import Enum
+from app.models._factories import new_id, utcnow
+
+
+# Schema examples, shared by the item and list response models
+
+_EXAMPLE_DOCUMENT = {
+    "document_id": "770e8400-e29b-41d4-a716-446655440002",
+    "filename": "product_overview.pdf",
+    "content_type": "application/pdf",
+    "source": "upload",
+    "status": "indexed",
+    "file_size": 1024000,
+    "page_count": 15,
+    "chunk_count": 45,
+    "upload_date": "2026-02-19T10:00:00Z",
+    "indexed_at": "2026-02-19T10:01:30Z",
+    "error_message": None
+}
+
+_EXAMPLE_TALK_POINT = {
+    "talk_point_id": "880e8400-e29b-41d4-a716-446655440003",
+    "customer_name": "Acme Corp",
+    "customer_persona": "Technical CTO",
+    "deal_stage": "Proposal",
+    "generated_content": "# Talk Points\n\n## Key Messages\n- Security first...",
+    "created_at": "2026-02-19T11:00:00Z"
+}
 
 
 class DocumentStatus(str, Enum):
@@ -31,8 +57,8 @@ class DocumentCreate(BaseModel):
     source: DocumentSource = Field(default=DocumentSource.UPLOAD, description="Document source")
     source_metadata: Optional[Dict[str, Any]] = Field(default=None, description="Source-specific metadata (e.g., Drive file ID)")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "filename": "product_overview.pdf",
                 "content_type": "application/pdf",
@@ -40,11 +66,12 @@ class DocumentCreate(BaseModel):
                 "source_metadata": None
             }
         }
+    )
 
 
 class DocumentInDB(BaseModel):
     """Schema for document stored in database."""
-    document_id: str = Field(default_factory=lambda: str(uuid4()))
+    document_id: str = Field(default_factory=new_id)
     user_id: str = Field(..., description="ID of the user who owns this document")
     filename: str
     file_path: str = Field(..., description="Local path or cloud storage URL")
@@ -55,12 +82,14 @@ class DocumentInDB(BaseModel):
     file_size: Optional[int] = Field(None, description="File size in bytes")
     page_count: Optional[int] = Field(None, description="Number of pages (for PDFs)")
     chunk_count: Optional[int] = Field(None, description="Number of text chunks indexed")
-    upload_date: datetime = Field(default_factory=datetime.utcnow)
+    upload_date: datetime = Field(default_factory=utcnow)
     indexed_at: Optional[datetime] = Field(None, description="When indexing completed")
     error_message: Optional[str] = Field(None, description="Error message if status is ERROR")
     
-    class Config:
-        json_schema_extra = {
+    # Store status and source as plain strings rather than enum members
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "document_id": "770e8400-e29b-41d4-a716-446655440002",
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -78,6 +107,7 @@ class DocumentInDB(BaseModel):
                 "error_message": None
             }
         }
+    )
 
 
 class DocumentResponse(BaseModel):
@@ -94,22 +124,11 @@ class DocumentResponse(BaseModel):
     indexed_at: Optional[datetime] = None
     error_message: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "document_id": "770e8400-e29b-41d4-a716-446655440002",
-                "filename": "product_overview.pdf",
-                "content_type": "application/pdf",
-                "source": "upload",
-                "status": "indexed",
-                "file_size": 1024000,
-                "page_count": 15,
-                "chunk_count": 45,
-                "upload_date": "2026-02-19T10:00:00Z",
-                "indexed_at": "2026-02-19T10:01:30Z",
-                "error_message": None
-            }
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": _EXAMPLE_DOCUMENT
         }
+    )
 
 
 class DocumentListResponse(BaseModel):
@@ -119,15 +138,16 @@ class DocumentListResponse(BaseModel):
     limit: int
     offset: int
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
-                "documents": [],
-                "total": 0,
+                "documents": [_EXAMPLE_DOCUMENT],
+                "total": 1,
                 "limit": 20,
                 "offset": 0
             }
         }
+    )
 
 
 class DocumentUploadResponse(BaseModel):
@@ -137,8 +157,8 @@ class DocumentUploadResponse(BaseModel):
     status: DocumentStatus
     message: str
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "document_id": "770e8400-e29b-41d4-a716-446655440002",
                 "filename": "product_overview.pdf",
@@ -146,6 +166,7 @@ class DocumentUploadResponse(BaseModel):
                 "message": "Document uploaded successfully and is being processed"
             }
         }
+    )
 
 
 class TalkPointCreate(BaseModel):
@@ -155,8 +176,8 @@ class TalkPointCreate(BaseModel):
     deal_stage: Optional[str] = Field(None, description="Current deal stage")
     context: Optional[str] = Field(None, description="Additional context for talk point generation")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "customer_name": "Acme Corp",
                 "customer_persona": "Technical CTO",
@@ -164,21 +185,22 @@ class TalkPointCreate(BaseModel):
                 "context": "Focus on security and scalability features"
             }
         }
+    )
 
 
 class TalkPointInDB(BaseModel):
     """Schema for talk points stored in database."""
-    talk_point_id: str = Field(default_factory=lambda: str(uuid4()))
+    talk_point_id: str = Field(default_factory=new_id)
     user_id: str = Field(..., description="ID of the user who generated this")
     customer_name: Optional[str] = None
     customer_persona: Optional[str] = None
     deal_stage: Optional[str] = None
     context: Optional[str] = None
     generated_content: str = Field(..., description="Generated talk points in Markdown format")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "talk_point_id": "880e8400-e29b-41d4-a716-446655440003",
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -190,6 +212,7 @@ class TalkPointInDB(BaseModel):
                 "created_at": "2026-02-19T11:00:00Z"
             }
         }
+    )
 
 
 class TalkPointResponse(BaseModel):
@@ -201,14 +224,27 @@ class TalkPointResponse(BaseModel):
     generated_content: str
     created_at: datetime
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": _EXAMPLE_TALK_POINT
+        }
+    )
+
+
+class TalkPointListResponse(BaseModel):
+    """Schema for paginated talk point list response."""
+    talk_points: list[TalkPointResponse]
+    total: int
+    limit: int
+    skip: int
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
-                "talk_point_id": "880e8400-e29b-41d4-a716-446655440003",
-                "customer_name": "Acme Corp",
-                "customer_persona": "Technical CTO",
-                "deal_stage": "Proposal",
-                "generated_content": "# Talk Points\n\n## Key Messages\n- Security first...",
-                "created_at": "2026-02-19T11:00:00Z"
+                "talk_points": [_EXAMPLE_TALK_POINT],
+                "total": 1,
+                "limit": 20,
+                "skip": 0
             }
         }
+    )
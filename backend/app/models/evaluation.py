@@ -2,10 +2,44 @@
 Evaluation models for PRD performance assessment.
 Provides multi-dimensional scoring and improvement recommendations.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 from datetime import datetime
-from uuid import uuid4
+from app.models._factories import new_id, utcnow
+
+
+# Schema examples, shared by the models that document the same data
+
+_EXAMPLE_EVALUATION_SCORES = {
+    "clarity": 85,
+    "relevance": 90,
+    "confidence": 75,
+    "completeness": 80,
+    "feasibility": 85,
+    "innovation": 70
+}
+
+_EXAMPLE_EVALUATION = {
+    "evaluation_id": "770e8400-e29b-41d4-a716-446655440002",
+    "prd_id": "660e8400-e29b-41d4-a716-446655440001",
+    "user_id": "550e8400-e29b-41d4-a716-446655440000",
+    "scores": _EXAMPLE_EVALUATION_SCORES,
+    "overall_score": 81,
+    "strengths": [
+        "Clear problem definition and user value proposition",
+        "Well-defined target audience",
+        "Realistic timeline with milestones"
+    ],
+    "improvements": [
+        {
+            "area": "Success Metrics",
+            "suggestion": "Add quantifiable metrics with specific targets",
+            "priority": "high"
+        }
+    ],
+    "summary": "Strong PRD with clear vision. Focus on adding more specific metrics.",
+    "created_at": "2026-02-12T20:00:00Z"
+}
 
 
 class EvaluationScores(BaseModel):
@@ -17,17 +51,11 @@ class EvaluationScores(BaseModel):
     feasibility: int = Field(..., ge=0, le=100, description="Technical feasibility")
     innovation: int = Field(..., ge=0, le=100, description="Innovation and uniqueness")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "clarity": 85,
-                "relevance": 90,
-                "confidence": 75,
-                "completeness": 80,
-                "feasibility": 85,
-                "innovation": 70
-            }
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": _EXAMPLE_EVALUATION_SCORES
         }
+    )
 
 
 class ImprovementRecommendation(BaseModel):
@@ -36,19 +64,20 @@ class ImprovementRecommendation(BaseModel):
     suggestion: str = Field(..., description="Specific actionable suggestion")
     priority: str = Field(..., description="Priority level: high, medium, low")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "area": "Success Metrics",
                 "suggestion": "Add quantifiable metrics with specific targets (e.g., '90% user satisfaction' instead of 'high user satisfaction')",
                 "priority": "high"
             }
         }
+    )
 
 
 class EvaluationInDB(BaseModel):
     """Schema for evaluation stored in database."""
-    evaluation_id: str = Field(default_factory=lambda: str(uuid4()))
+    evaluation_id: str = Field(default_factory=new_id)
     prd_id: str = Field(..., description="ID of the evaluated PRD")
     user_id: str = Field(..., description="ID of the user who owns the PRD")
     scores: EvaluationScores
@@ -56,39 +85,13 @@ class EvaluationInDB(BaseModel):
     strengths: List[str] = Field(..., description="Key strengths identified (2-3 items)")
     improvements: List[ImprovementRecommendation] = Field(..., description="Improvement recommendations (3-5 items)")
     summary: str = Field(..., description="Overall evaluation summary")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "evaluation_id": "770e8400-e29b-41d4-a716-446655440002",
-                "prd_id": "660e8400-e29b-41d4-a716-446655440001",
-                "user_id": "550e8400-e29b-41d4-a716-446655440000",
-                "scores": {
-                    "clarity": 85,
-                    "relevance": 90,
-                    "confidence": 75,
-                    "completeness": 80,
-                    "feasibility": 85,
-                    "innovation": 70
-                },
-                "overall_score": 81,
-                "strengths": [
-                    "Clear problem definition and user value proposition",
-                    "Well-defined target audience",
-                    "Realistic timeline with milestones"
-                ],
-                "improvements": [
-                    {
-                        "area": "Success Metrics",
-                        "suggestion": "Add quantifiable metrics with specific targets",
-                        "priority": "high"
-                    }
-                ],
-                "summary": "Strong PRD with clear vision. Focus on adding more specific metrics.",
-                "created_at": "2026-02-12T20:00:00Z"
-            }
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": _EXAMPLE_EVALUATION
         }
+    )
 
 
 class EvaluationResponse(BaseModel):
@@ -103,36 +106,11 @@ class EvaluationResponse(BaseModel):
     summary: str
     created_at: datetime
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "evaluation_id": "770e8400-e29b-41d4-a716-446655440002",
-                "prd_id": "660e8400-e29b-41d4-a716-446655440001",
-                "user_id": "550e8400-e29b-41d4-a716-446655440000",
-                "scores": {
-                    "clarity": 85,
-                    "relevance": 90,
-                    "confidence": 75,
-                    "completeness": 80,
-                    "feasibility": 85,
-                    "innovation": 70
-                },
-                "overall_score": 81,
-                "strengths": [
-                    "Clear problem definition",
-                    "Well-defined target audience"
-                ],
-                "improvements": [
-                    {
-                        "area": "Success Metrics",
-                        "suggestion": "Add quantifiable metrics",
-                        "priority": "high"
-                    }
-                ],
-                "summary": "Strong PRD with clear vision",
-                "created_at": "2026-02-12T20:00:00Z"
-            }
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": _EXAMPLE_EVALUATION
         }
+    )
 
 
 class EvaluationRequest(BaseModel):
@@ -142,9 +120,10 @@ class EvaluationRequest(BaseModel):
         description="Force re-evaluation even if one exists"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "force_reevaluate": False
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
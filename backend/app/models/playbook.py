@@ -2,10 +2,12 @@
 Playbook models for Sales Playbook Builder feature.
 Handles playbook structure, scenarios, and content sections.
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.dataclasses import dataclass
+from typing import Optional
 from datetime import datetime
-from uuid import uuid4
+from app.models._factories import new_uuid, utcnow
+from app.models._types import LongText, Title
 from enum import Enum
 
 
@@ -16,6 +18,11 @@ class PlaybookStatus(str, Enum):
     ARCHIVED = "archived"
 
 
+def _construct(model, doc: dict):
+    """Build a model from the known fields of a stored document, without validation."""
+    return model.model_construct(**{name: doc[name] for name in model.model_fields if name in doc})
+
+
 class DealStage(str, Enum):
     """Enum for B2B sales lifecycle stages."""
     PROSPECTING = "Prospecting"
@@ -32,13 +39,14 @@ class ObjectionResponse(BaseModel):
     objection: str = Field(..., description="The potential objection from the customer")
     response: str = Field(..., description="Suggested response or handling strategy")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "objection": "Your solution is too expensive",
                 "response": "Let's discuss the ROI and total cost of ownership over time..."
             }
         }
+    )
 
 
 class CompetitiveBattleCard(BaseModel):
@@ -48,8 +56,8 @@ class CompetitiveBattleCard(BaseModel):
     their_weakness: str = Field(..., description="Their weakness or limitation")
     key_differentiator: str = Field(..., description="Key differentiator to emphasize")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "competitor_name": "Competitor X",
                 "our_advantage": "Better integration capabilities",
@@ -57,21 +65,22 @@ class CompetitiveBattleCard(BaseModel):
                 "key_differentiator": "Native integrations with 100+ platforms"
             }
         }
+    )
 
 
 class ContentSection(BaseModel):
     """Model for scenario content sections."""
     opening_strategy: Optional[str] = Field(None, description="How to start the conversation")
-    key_messages: List[str] = Field(default_factory=list, description="Main points to communicate")
-    value_propositions: List[str] = Field(default_factory=list, description="Why choose us")
-    proof_points: List[str] = Field(default_factory=list, description="Evidence/Case studies")
-    discovery_questions: List[str] = Field(default_factory=list, description="Questions to ask")
-    objection_handling: List[ObjectionResponse] = Field(default_factory=list, description="Objection responses")
-    competitive_battle_cards: List[CompetitiveBattleCard] = Field(default_factory=list, description="Competitive positioning")
-    next_steps: List[str] = Field(default_factory=list, description="How to advance the deal")
+    key_messages: list[str] = Field(default_factory=list, description="Main points to communicate")
+    value_propositions: list[str] = Field(default_factory=list, description="Why choose us")
+    proof_points: list[str] = Field(default_factory=list, description="Evidence/Case studies")
+    discovery_questions: list[str] = Field(default_factory=list, description="Questions to ask")
+    objection_handling: list[ObjectionResponse] = Field(default_factory=list, description="Objection responses")
+    competitive_battle_cards: list[CompetitiveBattleCard] = Field(default_factory=list, description="Competitive positioning")
+    next_steps: list[str] = Field(default_factory=list, description="How to advance the deal")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "opening_strategy": "Start with a warm introduction and reference previous conversation",
                 "key_messages": ["We reduce costs by 40%", "Implementation takes 2 weeks"],
@@ -83,20 +92,22 @@ class ContentSection(BaseModel):
                 "next_steps": ["Schedule technical demo", "Share pricing proposal"]
             }
         }
+    )
 
 
 class Scenario(BaseModel):
     """Model for a scenario within a playbook."""
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique scenario identifier")
+    id: str = Field(default_factory=new_uuid, description="Unique scenario identifier")
     title: str = Field(..., description="Scenario name (e.g., 'Discovery Call')")
     deal_stage: DealStage = Field(..., description="Deal stage this scenario applies to")
     meeting_context: Optional[str] = Field(None, description="Context of the meeting")
-    customer_pain_points: List[str] = Field(default_factory=list, description="Customer pain points to address")
-    competitors: List[str] = Field(default_factory=list, description="Competitors to address")
+    customer_pain_points: list[str] = Field(default_factory=list, description="Customer pain points to address")
+    competitors: list[str] = Field(default_factory=list, description="Competitors to address")
     content: ContentSection = Field(default_factory=ContentSection, description="Scenario content")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
                 "title": "Discovery Call",
@@ -107,18 +118,19 @@ class Scenario(BaseModel):
                 "content": {}
             }
         }
+    )
 
 
 class ScenarioCreate(BaseModel):
     """Schema for creating a new scenario."""
-    title: str = Field(..., min_length=1, max_length=200, description="Scenario name")
+    title: Title = Field(..., description="Scenario name")
     deal_stage: DealStage = Field(..., description="Deal stage")
-    meeting_context: Optional[str] = Field(None, description="Meeting context")
-    customer_pain_points: List[str] = Field(default_factory=list, description="Customer pain points")
-    competitors: List[str] = Field(default_factory=list, description="Competitors")
+    meeting_context: Optional[LongText] = Field(None, description="Meeting context")
+    customer_pain_points: list[str] = Field(default_factory=list, description="Customer pain points")
+    competitors: list[str] = Field(default_factory=list, description="Competitors")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Discovery Call",
                 "deal_stage": "Discovery",
@@ -127,36 +139,38 @@ class ScenarioCreate(BaseModel):
                 "competitors": ["Competitor A"]
             }
         }
+    )
 
 
 class ScenarioUpdate(BaseModel):
     """Schema for updating a scenario."""
-    title: Optional[str] = Field(None, min_length=1, max_length=200)
+    title: Optional[Title] = None
     deal_stage: Optional[DealStage] = None
-    meeting_context: Optional[str] = None
-    customer_pain_points: Optional[List[str]] = None
-    competitors: Optional[List[str]] = None
+    meeting_context: Optional[LongText] = None
+    customer_pain_points: Optional[list[str]] = None
+    competitors: Optional[list[str]] = None
     content: Optional[ContentSection] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Updated Discovery Call",
                 "meeting_context": "Updated context"
             }
         }
+    )
 
 
 class PlaybookCreate(BaseModel):
     """Schema for creating a new playbook."""
-    title: str = Field(..., min_length=1, max_length=200, description="Playbook title")
-    description: Optional[str] = Field(None, description="Playbook description")
+    title: Title = Field(..., description="Playbook title")
+    description: Optional[LongText] = Field(None, description="Playbook description")
     target_persona: Optional[str] = Field(None, description="Target customer persona")
     industry: Optional[str] = Field(None, description="Target industry")
     product_line: Optional[str] = Field(None, description="Product line")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Enterprise SaaS Sales Playbook",
                 "description": "Comprehensive playbook for selling to enterprise customers",
@@ -165,29 +179,31 @@ class PlaybookCreate(BaseModel):
                 "product_line": "Enterprise Security"
             }
         }
+    )
 
 
 class PlaybookUpdate(BaseModel):
     """Schema for updating a playbook."""
-    title: Optional[str] = Field(None, min_length=1, max_length=200)
-    description: Optional[str] = None
+    title: Optional[Title] = None
+    description: Optional[LongText] = None
     target_persona: Optional[str] = None
     industry: Optional[str] = None
     product_line: Optional[str] = None
     status: Optional[PlaybookStatus] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Updated Playbook Title",
                 "status": "published"
             }
         }
+    )
 
 
 class PlaybookInDB(BaseModel):
     """Schema for playbook stored in MongoDB."""
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique playbook identifier")
+    id: str = Field(default_factory=new_uuid, description="Unique playbook identifier")
     user_id: str = Field(..., description="ID of the user who owns this playbook")
     title: str = Field(..., description="Playbook title")
     description: Optional[str] = Field(None, description="Playbook description")
@@ -196,12 +212,13 @@ class PlaybookInDB(BaseModel):
     product_line: Optional[str] = Field(None, description="Product line")
     status: PlaybookStatus = Field(default=PlaybookStatus.DRAFT, description="Playbook status")
     is_template: bool = Field(default=False, description="Whether this is a template")
-    scenarios: List[Scenario] = Field(default_factory=list, description="List of scenarios")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
+    scenarios: list[Scenario] = Field(default_factory=list, description="List of scenarios")
+    created_at: datetime = Field(default_factory=utcnow, description="Creation timestamp")
+    updated_at: datetime = Field(default_factory=utcnow, description="Last update timestamp")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "id": "660e8400-e29b-41d4-a716-446655440001",
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -217,6 +234,36 @@ class PlaybookInDB(BaseModel):
                 "updated_at": "2026-02-20T20:00:00Z"
             }
         }
+    )
+    
+    @classmethod
+    def from_db(cls, doc: dict) -> "PlaybookInDB":
+        """
+        Build a playbook from a MongoDB document without validating it.
+        
+        Playbooks are only written through PlaybookInDB, so stored documents
+        already have its shape. Nested scenarios and their content are
+        constructed too, so the result serializes like a validated model.
+        Request bodies must still go through normal validation.
+        
+        Args:
+            doc: Playbook document as returned by Motor
+            
+        Returns:
+            PlaybookInDB instance
+        """
+        scenarios = []
+        for scenario in doc.get("scenarios", []):
+            content = dict(scenario.get("content") or {})
+            content["objection_handling"] = [
+                _construct(ObjectionResponse, item) for item in content.get("objection_handling", [])
+            ]
+            content["competitive_battle_cards"] = [
+                _construct(CompetitiveBattleCard, item) for item in content.get("competitive_battle_cards", [])
+            ]
+            scenarios.append(_construct(Scenario, {**scenario, "content": _construct(ContentSection, content)}))
+        
+        return _construct(cls, {**doc, "scenarios": scenarios})
 
 
 class PlaybookResponse(BaseModel):
@@ -230,12 +277,13 @@ class PlaybookResponse(BaseModel):
     product_line: Optional[str]
     status: PlaybookStatus
     is_template: bool
-    scenarios: List[Scenario]
+    scenarios: list[Scenario]
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "id": "660e8400-e29b-41d4-a716-446655440001",
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -251,17 +299,18 @@ class PlaybookResponse(BaseModel):
                 "updated_at": "2026-02-20T20:00:00Z"
             }
         }
+    )
 
 
 class PlaybookListResponse(BaseModel):
     """Schema for paginated playbook list response."""
-    playbooks: List[PlaybookResponse]
+    playbooks: list[PlaybookResponse]
     total: int
     limit: int
     offset: int
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "playbooks": [],
                 "total": 0,
@@ -269,17 +318,21 @@ class PlaybookListResponse(BaseModel):
                 "offset": 0
             }
         }
+    )
 
 
-class GeneratePlaybookRequest(BaseModel):
-    """Schema for AI playbook generation request."""
-    target_persona: Optional[str] = Field(None, description="Target customer persona")
-    industry: Optional[str] = Field(None, description="Target industry")
-    product_line: Optional[str] = Field(None, description="Product line")
-    goals: List[str] = Field(default_factory=list, description="Business goals")
-    
-    class Config:
-        json_schema_extra = {
+# Validates and serializes a page of playbooks in one pass, so list routes can
+# build the response body without nesting response models in PlaybookListResponse
+PLAYBOOK_LIST_ADAPTER = TypeAdapter(list[PlaybookResponse])
+
+
+# Request-only schemas that are just read field by field are slotted
+# dataclasses rather than models
+@dataclass(
+    slots=True,
+    kw_only=True,
+    config=ConfigDict(
+        json_schema_extra={
             "example": {
                 "target_persona": "CTO",
                 "industry": "SaaS",
@@ -287,17 +340,29 @@ class GeneratePlaybookRequest(BaseModel):
                 "goals": ["Increase adoption", "Upsell premium features"]
             }
         }
+    )
+)
+class GeneratePlaybookRequest:
+    """Schema for AI playbook generation request."""
+    target_persona: Optional[str] = Field(None, description="Target customer persona")
+    industry: Optional[str] = Field(None, description="Target industry")
+    product_line: Optional[str] = Field(None, description="Product line")
+    goals: list[str] = Field(default_factory=list, description="Business goals")
 
 
-class GenerateScenarioContentRequest(BaseModel):
-    """Schema for AI scenario content generation request."""
-    focus_areas: List[str] = Field(default_factory=list, description="Areas to focus on")
-    additional_context: Optional[str] = Field(None, description="Additional context for generation")
-    
-    class Config:
-        json_schema_extra = {
+@dataclass(
+    slots=True,
+    kw_only=True,
+    config=ConfigDict(
+        json_schema_extra={
             "example": {
                 "focus_areas": ["Pricing objections", "Technical integration"],
                 "additional_context": "Customer is worried about implementation time"
             }
         }
+    )
+)
+class GenerateScenarioContentRequest:
+    """Schema for AI scenario content generation request."""
+    focus_areas: list[str] = Field(default_factory=list, description="Areas to focus on")
+    additional_context: Optional[LongText] = Field(None, description="Additional context for generation")
@@ -1,10 +1,11 @@
 """
 PRD (Product Requirements Document) models for the application.
 """
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter
+from typing import Annotated, Optional, List
 from datetime import datetime
-from uuid import uuid4
+from app.models._factories import new_uuid, utcnow
+from app.models._types import LongText, Title
 from enum import Enum
 
 
@@ -26,18 +27,27 @@ class PRDPriority(str, Enum):
     CRITICAL = "critical"
 
 
+def _none_to_empty(value):
+    """Read a null list as an empty one."""
+    return [] if value is None else value
+
+
+# success_metrics is always a list; older PRDs and clients may send null
+MetricList = Annotated[list[str], BeforeValidator(_none_to_empty)]
+
+
 class PRDCreate(BaseModel):
     """Schema for creating a new PRD."""
-    title: str = Field(..., min_length=1, max_length=200, description="PRD title")
-    description: Optional[str] = Field(None, description="Detailed description of the PRD")
+    title: Title = Field(..., description="PRD title")
+    description: Optional[LongText] = Field(None, description="Detailed description of the PRD")
     status: PRDStatus = Field(default=PRDStatus.DRAFT, description="Current status of the PRD")
     priority: PRDPriority = Field(default=PRDPriority.MEDIUM, description="Priority level")
     target_audience: Optional[str] = Field(None, description="Target audience for the product")
-    success_metrics: Optional[List[str]] = Field(default=None, description="Success metrics for the PRD")
+    success_metrics: MetricList = Field(default_factory=list, description="Success metrics for the PRD")
     timeline: Optional[str] = Field(None, description="Expected timeline for completion")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "User Authentication System",
                 "description": "Implement JWT-based authentication with signup, login, and logout",
@@ -48,43 +58,46 @@ class PRDCreate(BaseModel):
                 "timeline": "2 weeks"
             }
         }
+    )
 
 
 class PRDUpdate(BaseModel):
     """Schema for updating an existing PRD."""
-    title: Optional[str] = Field(None, min_length=1, max_length=200, description="PRD title")
-    description: Optional[str] = Field(None, description="Detailed description of the PRD")
+    title: Optional[Title] = Field(None, description="PRD title")
+    description: Optional[LongText] = Field(None, description="Detailed description of the PRD")
     status: Optional[PRDStatus] = Field(None, description="Current status of the PRD")
     priority: Optional[PRDPriority] = Field(None, description="Priority level")
     target_audience: Optional[str] = Field(None, description="Target audience for the product")
-    success_metrics: Optional[List[str]] = Field(None, description="Success metrics for the PRD")
+    success_metrics: MetricList = Field(default_factory=list, description="Success metrics for the PRD")
     timeline: Optional[str] = Field(None, description="Expected timeline for completion")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "in_review",
                 "priority": "critical"
             }
         }
+    )
 
 
 class PRDInDB(BaseModel):
     """Schema for PRD stored in database."""
-    prd_id: str = Field(default_factory=lambda: str(uuid4()))
+    prd_id: str = Field(default_factory=new_uuid)
     user_id: str = Field(..., description="ID of the user who owns this PRD")
     title: str
     description: Optional[str] = None
     status: PRDStatus = PRDStatus.DRAFT
     priority: PRDPriority = PRDPriority.MEDIUM
     target_audience: Optional[str] = None
-    success_metrics: Optional[List[str]] = None
+    success_metrics: MetricList = Field(default_factory=list)
     timeline: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "prd_id": "660e8400-e29b-41d4-a716-446655440001",
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -99,6 +112,23 @@ class PRDInDB(BaseModel):
                 "updated_at": "2026-02-12T17:00:00Z"
             }
         }
+    )
+    
+    @classmethod
+    def from_db(cls, doc: dict) -> "PRDInDB":
+        """
+        Build a PRD from a MongoDB document without validating it.
+        
+        PRDs are only written through PRDInDB, so stored documents already
+        have its shape. Request bodies must still go through normal validation.
+        
+        Args:
+            doc: PRD document as returned by Motor
+            
+        Returns:
+            PRDInDB instance
+        """
+        return cls.model_construct(**{name: doc[name] for name in cls.model_fields if name in doc})
 
 
 class PRDResponse(BaseModel):
@@ -110,13 +140,14 @@ class PRDResponse(BaseModel):
     status: PRDStatus
     priority: PRDPriority
     target_audience: Optional[str] = None
-    success_metrics: Optional[List[str]] = None
+    success_metrics: MetricList = Field(default_factory=list)
     timeline: Optional[str] = None
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "prd_id": "660e8400-e29b-41d4-a716-446655440001",
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -131,6 +162,7 @@ class PRDResponse(BaseModel):
                 "updated_at": "2026-02-12T17:00:00Z"
             }
         }
+    )
 
 
 class PRDListResponse(BaseModel):
@@ -140,12 +172,18 @@ class PRDListResponse(BaseModel):
     limit: int
     offset: int
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "prds": [],
                 "total": 0,
                 "limit": 10,
                 "offset": 0
             }
-        }
\ No newline at end of file
+        }
+    )
+
+
+# Validates and serializes a page of PRDs in one pass, so list routes can
+# build the response body without nesting response models in PRDListResponse
+PRD_LIST_ADAPTER = TypeAdapter(List[PRDResponse])
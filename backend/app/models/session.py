@@ -2,11 +2,14 @@
 Session models for Sales Call Prep preparation sessions.
 Handles session setup, chat messages, and session state management.
 """
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.dataclasses import dataclass
+from typing import Literal, Optional, List
 from datetime import datetime
-from uuid import uuid4
+from app.models._factories import new_uuid, utcnow
+from app.models._types import LongText
 from enum import Enum
+from app.models.session_evaluation import SessionEvaluationResponse
 
 
 class PreparationType(str, Enum):
@@ -40,13 +43,13 @@ class SessionStatus(str, Enum):
 
 class ChatMessage(BaseModel):
     """Single chat message in a session."""
-    role: str = Field(..., description="Message role: 'ai' or 'user'")
+    role: Literal["ai", "user"] = Field(..., description="Message role: 'ai' or 'user'")
     message: str = Field(..., description="Message content")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
     retrieved_context_ids: Optional[List[str]] = Field(default=None, description="Document IDs used for RAG context")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "role": "ai",
                 "message": "Tell me about a time you led a project...",
@@ -54,13 +57,14 @@ class ChatMessage(BaseModel):
                 "retrieved_context_ids": []
             }
         }
+    )
 
 
-class SessionSetup(BaseModel):
-    """Session setup configuration."""
+class SessionCreate(BaseModel):
+    """Schema for creating a new session."""
     preparation_type: PreparationType = Field(..., description="Type of preparation session")
     meeting_subtype: Optional[str] = Field(None, description="Specific subtype (e.g., 'Behavioral', 'Technical')")
-    agenda: Optional[str] = Field(None, description="Session agenda or focus")
+    agenda: Optional[LongText] = Field(None, description="Session agenda or focus")
     tone: str = Field(default="Professional & Confident", description="Desired conversation tone")
     role_context: Optional[str] = Field(None, description="User's background/role context")
     # Sales-specific fields
@@ -68,8 +72,8 @@ class SessionSetup(BaseModel):
     customer_persona: Optional[str] = Field(None, description="Customer persona (e.g., 'Skeptical CFO', 'Technical CTO')")
     deal_stage: Optional[DealStage] = Field(None, description="Current stage in sales lifecycle")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "preparation_type": "Sales",
                 "meeting_subtype": "Discovery Call",
@@ -81,49 +85,43 @@ class SessionSetup(BaseModel):
                 "deal_stage": "Discovery"
             }
         }
+    )
 
 
-class SessionCreate(BaseModel):
-    """Schema for creating a new session."""
-    preparation_type: PreparationType
-    meeting_subtype: Optional[str] = None
+# Session setup configuration is the same schema as session creation
+SessionSetup = SessionCreate
+
+
+class SessionContext(BaseModel):
+    """Session context stored with a session and used to build its prompt."""
     agenda: Optional[str] = None
     tone: str = "Professional & Confident"
     role_context: Optional[str] = None
     # Sales-specific fields
     customer_name: Optional[str] = None
     customer_persona: Optional[str] = None
-    deal_stage: Optional[DealStage] = None
+    deal_stage: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "preparation_type": "Sales",
-                "meeting_subtype": "Discovery Call",
-                "agenda": "Understand customer pain points",
-                "tone": "Professional & Confident",
-                "role_context": "Enterprise Sales Rep",
-                "customer_name": "Acme Corp",
-                "customer_persona": "Skeptical CFO",
-                "deal_stage": "Discovery"
-            }
-        }
+    # Keep any other keys found in older session documents
+    model_config = ConfigDict(extra="allow")
 
 
 class SessionInDB(BaseModel):
     """Schema for session stored in database."""
-    session_id: str = Field(default_factory=lambda: str(uuid4()))
+    session_id: str = Field(default_factory=new_uuid)
     user_id: str = Field(..., description="ID of the user who owns this session")
     preparation_type: PreparationType
     meeting_subtype: Optional[str] = None
-    context_payload: dict = Field(default_factory=dict, description="Session context (agenda, tone, role)")
+    context_payload: SessionContext = Field(default_factory=SessionContext, description="Session context (agenda, tone, role)")
+    context_prompt: Optional[str] = Field(None, description="Precomputed system prompt built from the session context")
     transcript: List[ChatMessage] = Field(default_factory=list, description="Conversation history")
     status: SessionStatus = Field(default=SessionStatus.IN_PROGRESS)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
     completed_at: Optional[datetime] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "session_id": "660e8400-e29b-41d4-a716-446655440001",
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -140,6 +138,7 @@ class SessionInDB(BaseModel):
                 "completed_at": None
             }
         }
+    )
 
 
 class SessionResponse(BaseModel):
@@ -154,8 +153,10 @@ class SessionResponse(BaseModel):
     created_at: datetime
     completed_at: Optional[datetime] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "session_id": "660e8400-e29b-41d4-a716-446655440001",
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -177,6 +178,48 @@ class SessionResponse(BaseModel):
                 "completed_at": None
             }
         }
+    )
+    
+    @classmethod
+    def to_json_bytes(cls, obj: "SessionResponse") -> bytes:
+        """
+        Serialize a session straight to JSON with pydantic-core.
+        
+        Long transcripts are encoded in one pass, without building an
+        intermediate dict for FastAPI's encoder.
+        
+        Args:
+            obj: Session (or subclass) instance to serialize
+            
+        Returns:
+            UTF-8 encoded JSON body
+        """
+        return obj.__pydantic_serializer__.to_json(obj)
+
+
+class SessionDetailResponse(SessionResponse):
+    """Schema for a session returned together with its evaluation."""
+    evaluation: Optional[SessionEvaluationResponse] = Field(None, description="Session evaluation, if one exists")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "session_id": "660e8400-e29b-41d4-a716-446655440001",
+                "user_id": "550e8400-e29b-41d4-a716-446655440000",
+                "preparation_type": "Interview",
+                "meeting_subtype": "Behavioral",
+                "context_payload": {
+                    "agenda": "Practice STAR method",
+                    "tone": "Professional & Confident"
+                },
+                "transcript": [],
+                "status": "completed",
+                "created_at": "2026-02-13T03:00:00Z",
+                "completed_at": "2026-02-13T03:30:00Z",
+                "evaluation": None
+            }
+        }
+    )
 
 
 class SessionListResponse(BaseModel):
@@ -186,8 +229,9 @@ class SessionListResponse(BaseModel):
     limit: int
     offset: int
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "sessions": [],
                 "total": 0,
@@ -195,41 +239,59 @@ class SessionListResponse(BaseModel):
                 "offset": 0
             }
         }
+    )
 
 
-class SendMessageRequest(BaseModel):
-    """Schema for sending a message in a session."""
-    message: str = Field(..., min_length=1, description="User's message")
-    
-    class Config:
-        json_schema_extra = {
+# Validates and serializes a page of sessions in one pass, so list routes can
+# build the response body without nesting response models in SessionListResponse
+SESSION_LIST_ADAPTER = TypeAdapter(List[SessionResponse])
+
+
+# The per-turn message schemas are slotted dataclasses rather than models,
+# since they only carry fields read and returned by send_message
+@dataclass(
+    slots=True,
+    kw_only=True,
+    config=ConfigDict(
+        json_schema_extra={
             "example": {
                 "message": "In my previous role as a PM, I led a cross-functional team..."
             }
         }
+    )
+)
+class SendMessageRequest:
+    """Schema for sending a message in a session."""
+    message: str = Field(..., min_length=1, description="User's message")
 
 
-class SendMessageResponse(BaseModel):
-    """Schema for message response."""
-    ai_response: str = Field(..., description="AI's response message")
-    turn_number: int = Field(..., description="Current turn number in conversation")
-    
-    class Config:
-        json_schema_extra = {
+@dataclass(
+    slots=True,
+    kw_only=True,
+    frozen=True,
+    config=ConfigDict(
+        json_schema_extra={
             "example": {
                 "ai_response": "That's a great start. Can you tell me more about the specific challenges you faced?",
                 "turn_number": 3
             }
         }
+    )
+)
+class SendMessageResponse:
+    """Schema for message response."""
+    ai_response: str = Field(..., description="AI's response message")
+    turn_number: int = Field(..., description="Current turn number in conversation")
 
 
 class SessionUpdate(BaseModel):
     """Schema for updating session status."""
     status: Optional[SessionStatus] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "completed"
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
@@ -2,10 +2,40 @@
 Session evaluation models for Interview OS.
 Provides multi-dimensional scoring for interview preparation sessions.
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional
+import logging
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, field_validator
+from typing import Annotated, Dict, List, Literal, Optional
 from datetime import datetime
-from uuid import uuid4
+from app.models._factories import new_uuid, utcnow
+
+logger = logging.getLogger(__name__)
+
+IMPROVEMENT_LEVELS = ("weak", "solid", "strong")
+IMPROVEMENT_PRIORITIES = ("high", "medium", "low")
+
+
+def coerce_context_scores(value):
+    """
+    Round stored context scores to ints, dropping entries that aren't numbers.
+    
+    Older evaluations stored the model's raw output, which can include float
+    scores or nested objects.
+    
+    Args:
+        value: Raw context_scores from MongoDB or the model
+        
+    Returns:
+        Dict of integer scores, or None when nothing usable remains
+    """
+    if not isinstance(value, dict):
+        return None
+    return {
+        name: round(score) for name, score in value.items()
+        if isinstance(score, (int, float)) and not isinstance(score, bool)
+    } or None
+
+
+ContextScores = Annotated[Optional[Dict[str, int]], BeforeValidator(coerce_context_scores)]
 
 
 class SessionEvaluationScores(BaseModel):
@@ -17,8 +47,8 @@ class SessionEvaluationScores(BaseModel):
     tone_alignment: int = Field(..., ge=0, le=100, description="Alignment with desired tone")
     engagement: int = Field(..., ge=0, le=100, description="Engagement and enthusiasm")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "clarity_structure": 85,
                 "relevance_focus": 90,
@@ -28,17 +58,40 @@ class SessionEvaluationScores(BaseModel):
                 "engagement": 80
             }
         }
+    )
 
 
 class ImprovementArea(BaseModel):
     """Single improvement area with specific recommendation."""
     dimension: str = Field(..., description="Dimension that needs improvement")
-    current_level: str = Field(..., description="Current performance level (weak, solid, strong)")
+    current_level: Literal[IMPROVEMENT_LEVELS] = Field(..., description="Current performance level (weak, solid, strong)")
     suggestion: str = Field(..., description="Specific actionable suggestion")
-    priority: str = Field(..., description="Priority level: high, medium, low")
+    priority: Literal[IMPROVEMENT_PRIORITIES] = Field(..., description="Priority level: high, medium, low")
+    
+    @field_validator("current_level", mode="before")
+    @classmethod
+    def normalize_current_level(cls, value):
+        """Read legacy levels like "Solid " as "solid"; unknown levels fall back to "solid"."""
+        level = str(value or "").strip().lower()
+        if level not in IMPROVEMENT_LEVELS:
+            level = "solid"
+        if level != value:
+            logger.warning(f"Coerced improvement level {value!r} to {level!r}")
+        return level
     
-    class Config:
-        json_schema_extra = {
+    @field_validator("priority", mode="before")
+    @classmethod
+    def normalize_priority(cls, value):
+        """Read legacy priorities in any casing; unknown priorities fall back to "medium"."""
+        priority = str(value or "").strip().lower()
+        if priority not in IMPROVEMENT_PRIORITIES:
+            priority = "medium"
+        if priority != value:
+            logger.warning(f"Coerced improvement priority {value!r} to {priority!r}")
+        return priority
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "dimension": "Clarity & Structure",
                 "current_level": "solid",
@@ -46,24 +99,25 @@ class ImprovementArea(BaseModel):
                 "priority": "high"
             }
         }
+    )
 
 
 class SessionEvaluationInDB(BaseModel):
     """Schema for session evaluation stored in database."""
-    evaluation_id: str = Field(default_factory=lambda: str(uuid4()))
+    evaluation_id: str = Field(default_factory=new_uuid)
     session_id: str = Field(..., description="ID of the evaluated session")
     user_id: str = Field(..., description="ID of the user who owns the session")
     universal_scores: SessionEvaluationScores = Field(..., description="Universal dimension scores")
-    context_scores: Optional[dict] = Field(None, description="Context-specific scores (varies by prep type)")
+    context_scores: ContextScores = Field(None, description="Context-specific scores (varies by prep type)")
     improvement_areas: List[ImprovementArea] = Field(..., description="Top 2-3 improvement areas")
     practice_suggestions: List[str] = Field(..., description="Specific practice suggestions")
     strengths: List[str] = Field(..., description="Key strengths identified (2-3 items)")
     overall_score: int = Field(..., ge=0, le=100, description="Weighted average of all scores")
     summary: str = Field(..., description="Overall evaluation summary")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "evaluation_id": "770e8400-e29b-41d4-a716-446655440002",
                 "session_id": "660e8400-e29b-41d4-a716-446655440001",
@@ -102,6 +156,7 @@ class SessionEvaluationInDB(BaseModel):
                 "created_at": "2026-02-13T03:30:00Z"
             }
         }
+    )
 
 
 class SessionEvaluationResponse(BaseModel):
@@ -110,7 +165,7 @@ class SessionEvaluationResponse(BaseModel):
     session_id: str
     user_id: str
     universal_scores: SessionEvaluationScores
-    context_scores: Optional[dict] = None
+    context_scores: ContextScores = None
     improvement_areas: List[ImprovementArea]
     practice_suggestions: List[str]
     strengths: List[str]
@@ -118,8 +173,9 @@ class SessionEvaluationResponse(BaseModel):
     summary: str
     created_at: datetime
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "evaluation_id": "770e8400-e29b-41d4-a716-446655440002",
                 "session_id": "660e8400-e29b-41d4-a716-446655440001",
@@ -153,6 +209,7 @@ class SessionEvaluationResponse(BaseModel):
                 "created_at": "2026-02-13T03:30:00Z"
             }
         }
+    )
 
 
 class EvaluateSessionRequest(BaseModel):
@@ -162,9 +219,10 @@ class EvaluateSessionRequest(BaseModel):
         description="Force re-evaluation even if one exists"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "force_reevaluate": False
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
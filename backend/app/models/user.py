@@ -1,10 +1,30 @@
 """
 User models for authentication and user management.
 """
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+from typing import Optional, Dict, Any, Literal
 from datetime import datetime
-from uuid import uuid4
+from app.models._factories import new_uuid, utcnow
+from app.models._types import Password
+
+ACTIVATION_STATES = ("new", "activated")
+
+
+def normalize_activation_state(value) -> str:
+    """
+    Map a stored activation state onto "new" or "activated".
+    
+    Older user documents were written before activation_state was a Literal
+    and may hold other casings, stray whitespace, or no value at all.
+    
+    Args:
+        value: Raw activation_state from MongoDB
+        
+    Returns:
+        "activated" for any activated spelling, otherwise "new"
+    """
+    state = str(value or "").strip().lower()
+    return state if state in ACTIVATION_STATES else "new"
 
 
 class CompanyProfile(BaseModel):
@@ -14,8 +34,8 @@ class CompanyProfile(BaseModel):
     value_proposition: Optional[str] = Field(None, description="Key value proposition or unique selling points")
     industry: Optional[str] = Field(None, description="Industry or market segment")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Acme SaaS Platform",
                 "description": "Enterprise project management software",
@@ -23,36 +43,45 @@ class CompanyProfile(BaseModel):
                 "industry": "Software/SaaS"
             }
         }
+    )
 
 
 class UserCreate(BaseModel):
     """Schema for user registration."""
     email: EmailStr
-    password: str = Field(..., min_length=8, description="Password must be at least 8 characters")
+    password: Password = Field(..., description="Password must be 8-128 characters")
     name: Optional[str] = None
 
 
 class UserInDB(BaseModel):
     """Schema for user stored in database."""
-    user_id: str = Field(default_factory=lambda: str(uuid4()))
+    user_id: str = Field(default_factory=new_uuid)
     email: EmailStr
     password_hash: str
     name: Optional[str] = None
-    activation_state: str = Field(default="new", description="User activation state: new or activated")
+    activation_state: Literal["new", "activated"] = Field(default="new", description="User activation state: new or activated")
+    tier: str = Field(default="standard", description="Subscription tier: standard or premium")
     company_profile: Optional[Dict[str, Any]] = Field(default=None, description="Company/product profile information")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    last_active_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    last_active_at: datetime = Field(default_factory=utcnow)
     reset_token: Optional[str] = Field(default=None, description="Password reset token")
     reset_token_expires_at: Optional[datetime] = Field(default=None, description="Reset token expiration time")
     
-    class Config:
-        json_schema_extra = {
+    @field_validator("activation_state", mode="before")
+    @classmethod
+    def normalize_state(cls, value):
+        """Accept legacy activation states stored before the field was a Literal."""
+        return normalize_activation_state(value)
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
                 "email": "user@example.com",
                 "password_hash": "$argon2id$...",
                 "name": "John Doe",
                 "activation_state": "new",
+                "tier": "standard",
                 "company_profile": {
                     "name": "Acme SaaS",
                     "description": "Enterprise software",
@@ -62,6 +91,7 @@ class UserInDB(BaseModel):
                 "last_active_at": "2026-02-11T20:30:00Z"
             }
         }
+    )
 
 
 class UserResponse(BaseModel):
@@ -69,11 +99,18 @@ class UserResponse(BaseModel):
     user_id: str
     email: EmailStr
     name: Optional[str] = None
-    activation_state: str
+    activation_state: Literal["new", "activated"]
     company_profile: Optional[Dict[str, Any]] = None
     
-    class Config:
-        json_schema_extra = {
+    @field_validator("activation_state", mode="before")
+    @classmethod
+    def normalize_state(cls, value):
+        """Accept legacy activation states stored before the field was a Literal."""
+        return normalize_activation_state(value)
+    
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
                 "email": "user@example.com",
@@ -85,6 +122,7 @@ class UserResponse(BaseModel):
                 }
             }
         }
+    )
 
 
 class UserLogin(BaseModel):
@@ -100,8 +138,9 @@ class TokenResponse(BaseModel):
     name: Optional[str] = None
     token: str
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
                 "email": "user@example.com",
@@ -109,6 +148,7 @@ class TokenResponse(BaseModel):
                 "token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."
             }
         }
+    )
 
 
 class UserProfileUpdate(BaseModel):
@@ -117,8 +157,8 @@ class UserProfileUpdate(BaseModel):
     email: Optional[EmailStr] = Field(None, description="User's email address")
     company_profile: Optional[CompanyProfile] = Field(None, description="Company/product profile")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Jane Doe",
                 "email": "jane.doe@example.com",
@@ -129,44 +169,48 @@ class UserProfileUpdate(BaseModel):
                 }
             }
         }
+    )
 
 
 class PasswordChange(BaseModel):
     """Schema for changing user password."""
     old_password: str = Field(..., description="Current password")
-    new_password: str = Field(..., min_length=8, description="New password (min 8 characters)")
+    new_password: Password = Field(..., description="New password (8-128 characters)")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "old_password": "currentpassword123",
                 "new_password": "newpassword456"
             }
         }
+    )
 
 
 class AccountDeletion(BaseModel):
     """Schema for account deletion confirmation."""
     password: str = Field(..., description="Password confirmation for account deletion")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "password": "mypassword123"
             }
         }
+    )
 
 
 class ForgotPasswordRequest(BaseModel):
     """Schema for forgot password request."""
     email: EmailStr = Field(..., description="Email address to send reset link")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "user@example.com"
             }
         }
+    )
 
 
 class ForgotPasswordResponse(BaseModel):
@@ -174,36 +218,39 @@ class ForgotPasswordResponse(BaseModel):
     message: str
     reset_link: str = Field(..., description="Password reset link (for testing without email service)")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "message": "Password reset link generated",
                 "reset_link": "https://prapp-frontend.vercel.app/reset-password?token=abc123..."
             }
         }
+    )
 
 
 class ResetPasswordRequest(BaseModel):
     """Schema for reset password request."""
     token: str = Field(..., description="Password reset token from email link")
-    new_password: str = Field(..., min_length=8, description="New password (min 8 characters)")
+    new_password: Password = Field(..., description="New password (8-128 characters)")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "token": "abc123def456...",
                 "new_password": "newSecurePassword123"
             }
         }
+    )
 
 
 class ResetPasswordResponse(BaseModel):
     """Schema for reset password response."""
     message: str
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "message": "Password successfully reset"
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
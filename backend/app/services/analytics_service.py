@@ -2,6 +2,7 @@
 Analytics service for calculating performance trends and metrics.
 Provides insights into user progress over time based on session evaluations.
 """
+import asyncio
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from app.db.mongodb import get_database
@@ -10,9 +11,78 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# Evaluation fields used to compute analytics
+EVALUATION_HISTORY_PROJECTION = {
+    "_id": 0,
+    "evaluation_id": 1,
+    "session_id": 1,
+    "created_at": 1,
+    "overall_score": 1,
+    "universal_scores": 1,
+    "improvement_areas.dimension": 1
+}
+
+# Evaluation fields attached to each session in the session history
+SESSION_HISTORY_EVALUATION_PROJECTION = {
+    "_id": 0,
+    "session_id": 1,
+    "evaluation_id": 1,
+    "overall_score": 1,
+    "universal_scores": 1,
+    "created_at": 1
+}
+
+# Fields of the latest evaluation used for improvement recommendations
+LATEST_EVALUATION_PROJECTION = {
+    "_id": 0,
+    "created_at": 1,
+    "improvement_areas": 1,
+    "practice_suggestions": 1
+}
+
+
 class AnalyticsService:
     """Service for calculating user analytics and performance trends."""
     
+    @staticmethod
+    async def get_user_dashboard(user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch everything the analytics endpoints need.
+        
+        The history is read from a cursor sorted on the (user_id, created_at)
+        index, and the latest evaluation comes from a separate find_one on the
+        same index. Both queries run concurrently.
+        
+        Args:
+            user_id: The user's ID
+            
+        Returns:
+            Dictionary with "evaluations" (oldest first) and "latest" (or None),
+            or None if the database is not available
+        """
+        db = get_database()
+        if db is None:
+            logger.error("Database not available")
+            return None
+        
+        history_cursor = db.session_evaluations.find(
+            {"user_id": user_id},
+            EVALUATION_HISTORY_PROJECTION
+        ).sort("created_at", 1)
+        evaluations, latest = await asyncio.gather(
+            history_cursor.to_list(length=None),
+            db.session_evaluations.find_one(
+                {"user_id": user_id},
+                LATEST_EVALUATION_PROJECTION,
+                sort=[("created_at", -1)]
+            )
+        )
+        
+        return {
+            "evaluations": evaluations,
+            "latest": latest
+        }
+    
     @staticmethod
     async def calculate_user_analytics(user_id: str) -> Dict[str, Any]:
         """
@@ -21,6 +91,24 @@ class AnalyticsService:
         Args:
             user_id: The user's ID
             
+        Returns:
+            Analytics data as returned by build_analytics, or an empty dict if
+            the database is not available
+        """
+        dashboard = await AnalyticsService.get_user_dashboard(user_id)
+        if dashboard is None:
+            return {}
+        
+        return AnalyticsService.build_analytics(dashboard["evaluations"])
+    
+    @staticmethod
+    def build_analytics(evaluations: List[Dict]) -> Dict[str, Any]:
+        """
+        Build analytics from a user's session evaluations.
+        
+        Args:
+            evaluations: Evaluation documents, sorted by creation date
+            
         Returns:
             Dictionary containing analytics data including:
             - average_scores: Average scores across all dimensions
@@ -30,16 +118,6 @@ class AnalyticsService:
             - total_evaluations: Total number of evaluations
             - recent_trend: Trend direction (improving, stable, declining)
         """
-        db = get_database()
-        if db is None:
-            logger.error("Database not available")
-            return {}
-        
-        # Fetch all evaluations for the user, sorted by creation date
-        evaluations = await db.session_evaluations.find(
-            {"user_id": user_id}
-        ).sort("created_at", 1).to_list(length=None)
-        
         if not evaluations:
             return {
                 "average_scores": {},
@@ -295,11 +373,20 @@ class AnalyticsService:
         # Fetch sessions with pagination
         sessions = await db.sessions.find(query).sort("created_at", -1).skip(offset).limit(limit).to_list(length=limit)
         
+        # Fetch the evaluations of the whole page in one query
+        session_ids = [session.get("session_id") for session in sessions]
+        evaluations = []
+        if session_ids:
+            evaluations = await db.session_evaluations.find(
+                {"session_id": {"$in": session_ids}},
+                SESSION_HISTORY_EVALUATION_PROJECTION
+            ).to_list(length=len(session_ids))
+        evaluations_by_session = {evaluation["session_id"]: evaluation for evaluation in evaluations}
+        
         # Enrich with evaluation data
         enriched_sessions = []
         for session in sessions:
-            # Fetch evaluation for this session
-            evaluation = await db.session_evaluations.find_one({"session_id": session.get("session_id")})
+            evaluation = evaluations_by_session.get(session.get("session_id"))
             
             session_data = {
                 "session_id": session.get("session_id"),
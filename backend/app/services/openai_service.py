@@ -3,14 +3,104 @@ OpenAI service for AI-powered PRD generation, enhancement, and playbook generati
 Handles GPT-4 integration with comprehensive prompt engineering.
 """
 from openai import AsyncOpenAI
+import httpx
 from typing import Dict, Optional, List, Any
 import logging
 import json
 from app.core.config import settings
+from app.models._factories import new_uuid
+from app.models.playbook import ContentSection
+from app.models.session_evaluation import ImprovementArea, coerce_context_scores
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# System prompts for preparation sessions, keyed by preparation type
+SESSION_SYSTEM_PROMPTS = {
+    "Interview": """You are an expert interview coach helping someone prepare for job interviews. Your role is to:
+- Ask relevant interview questions based on the context
+- Provide constructive feedback on responses
+- Help improve communication skills
+- Maintain a supportive and encouraging tone
+- Focus on STAR method (Situation, Task, Action, Result) for behavioral questions
+- Ask follow-up questions to dig deeper into examples""",
+
+    "Corporate": """You are an expert corporate communication coach. Your role is to:
+- Help prepare for corporate meetings and presentations
+- Provide feedback on professional communication
+- Focus on clarity, conciseness, and impact
+- Help structure key messages effectively""",
+
+    "Pitch": """You are an expert pitch coach helping someone prepare investor or sales pitches. Your role is to:
+- Ask probing questions about the pitch
+- Help refine the value proposition
+- Focus on storytelling and persuasion
+- Provide feedback on clarity and impact""",
+
+    "Sales": """You are a prospective customer in a sales call simulation. Your role is to:
+- Act as the customer persona specified in the context
+- Ask realistic questions about the product/service based on your needs and concerns
+- Challenge the salesperson with objections appropriate to your deal stage
+- Show skepticism when appropriate, but be open to good answers
+- Ask follow-up questions to dig deeper into areas of interest or concern
+- Reference information from your company background when relevant
+- Behave realistically based on the deal stage (e.g., more exploratory in Discovery, more detail-focused in Proposal)
+
+IMPORTANT: You have access to background information about the product/service being sold. Use this information to:
+- Ask informed questions that a real customer would ask
+- Challenge claims with specific concerns
+- Reference features or capabilities mentioned in the documentation
+- Only use information that would be realistic for a customer to know or ask about""",
+
+    "Presentation": """You are an expert presentation coach. Your role is to:
+- Help prepare for presentations
+- Focus on structure, clarity, and engagement
+- Provide feedback on delivery and content
+- Help manage Q&A scenarios""",
+
+    "Other": """You are an expert communication coach. Your role is to:
+- Help prepare for various communication scenarios
+- Provide constructive feedback
+- Focus on clarity and effectiveness
+- Maintain a supportive tone"""
+}
+
+# ContentSection fields holding plain strings, cleaned after AI generation
+CONTENT_STRING_LIST_FIELDS = (
+    "key_messages",
+    "value_propositions",
+    "proof_points",
+    "discovery_questions",
+    "next_steps",
+)
+
+
+def clean_string_list(values: Any) -> Any:
+    """
+    Strip whitespace from generated strings and drop empty and duplicate entries.
+    
+    Duplicates are compared case-insensitively and the first occurrence is
+    kept, preserving the model's ordering. Anything that isn't a list of
+    strings is returned unchanged for ContentSection to validate.
+    
+    Args:
+        values: Value of a generated string list field
+        
+    Returns:
+        Cleaned list, or the original value
+    """
+    if not isinstance(values, list):
+        return values
+    
+    cleaned = {}
+    for value in values:
+        if not isinstance(value, str):
+            return values
+        value = value.strip()
+        if value:
+            cleaned.setdefault(value.casefold(), value)
+    return list(cleaned.values())
+
 
 class OpenAIService:
     """Service for interacting with OpenAI API for PRD operations."""
@@ -20,7 +110,19 @@ class OpenAIService:
         if not settings.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY is not configured")
         
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        # One pooled HTTP/2 client for the whole process so connections and
+        # TLS sessions are reused across requests
+        self.client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                timeout=60.0,
+                limits=httpx.Limits(
+                    max_connections=settings.OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS
+                )
+            )
+        )
         self.model = settings.OPENAI_MODEL
         logger.info(f"OpenAI service initialized with model: {self.model}")
     
@@ -526,7 +628,8 @@ Return your response as a valid JSON object with the specified fields."""
         meeting_subtype: Optional[str],
         context_payload: dict,
         transcript: List[dict],
-        retrieved_context: Optional[List[Dict[str, any]]] = None
+        retrieved_context: Optional[List[Dict[str, any]]] = None,
+        context_prompt: Optional[str] = None
     ) -> str:
         """
         Generate AI response for preparation session with optional RAG context.
@@ -537,6 +640,8 @@ Return your response as a valid JSON object with the specified fields."""
             context_payload: Session context (agenda, tone, role_context)
             transcript: Conversation history
             retrieved_context: Optional list of retrieved document chunks from RAG
+            context_prompt: Precomputed system prompt stored on the session;
+                built from the other arguments when not provided
             
         Returns:
             AI response message
@@ -547,11 +652,16 @@ Return your response as a valid JSON object with the specified fields."""
         logger.info(f"Generating session response for {preparation_type} session (RAG: {bool(retrieved_context)})")
         
         try:
+            if context_prompt is None:
+                context_prompt = self.build_session_context_prompt(
+                    preparation_type,
+                    meeting_subtype,
+                    context_payload
+                )
+            
             # Construct conversation prompt
             messages = self._construct_session_prompt(
-                preparation_type,
-                meeting_subtype,
-                context_payload,
+                context_prompt,
                 transcript,
                 retrieved_context
             )
@@ -581,78 +691,28 @@ Return your response as a valid JSON object with the specified fields."""
             logger.error(f"Error generating session response: {str(e)}")
             raise Exception(f"Failed to generate AI response: {str(e)}")
     
-    def _construct_session_prompt(
+    def build_session_context_prompt(
         self,
         preparation_type: str,
         meeting_subtype: Optional[str],
-        context_payload: dict,
-        transcript: List[dict],
-        retrieved_context: Optional[List[Dict[str, any]]] = None
-    ) -> List[Dict[str, str]]:
+        context_payload: dict
+    ) -> str:
         """
-        Construct prompt for preparation session with optional RAG context.
+        Build the static system prompt for a preparation session.
+        
+        The result only depends on the session setup, so it is computed once
+        when the session is created and stored with it. Keeping it identical
+        across turns lets OpenAI reuse its prompt cache for this prefix.
         
         Args:
             preparation_type: Type of preparation
             meeting_subtype: Specific subtype
             context_payload: Session context
-            transcript: Conversation history
-            retrieved_context: Optional retrieved document chunks
             
         Returns:
-            List of message dictionaries for OpenAI API
+            System prompt string
         """
-        # Build system prompt based on preparation type
-        system_prompts = {
-            "Interview": """You are an expert interview coach helping someone prepare for job interviews. Your role is to:
-- Ask relevant interview questions based on the context
-- Provide constructive feedback on responses
-- Help improve communication skills
-- Maintain a supportive and encouraging tone
-- Focus on STAR method (Situation, Task, Action, Result) for behavioral questions
-- Ask follow-up questions to dig deeper into examples""",
-            
-            "Corporate": """You are an expert corporate communication coach. Your role is to:
-- Help prepare for corporate meetings and presentations
-- Provide feedback on professional communication
-- Focus on clarity, conciseness, and impact
-- Help structure key messages effectively""",
-            
-            "Pitch": """You are an expert pitch coach helping someone prepare investor or sales pitches. Your role is to:
-- Ask probing questions about the pitch
-- Help refine the value proposition
-- Focus on storytelling and persuasion
-- Provide feedback on clarity and impact""",
-            
-            "Sales": """You are a prospective customer in a sales call simulation. Your role is to:
-- Act as the customer persona specified in the context
-- Ask realistic questions about the product/service based on your needs and concerns
-- Challenge the salesperson with objections appropriate to your deal stage
-- Show skepticism when appropriate, but be open to good answers
-- Ask follow-up questions to dig deeper into areas of interest or concern
-- Reference information from your company background when relevant
-- Behave realistically based on the deal stage (e.g., more exploratory in Discovery, more detail-focused in Proposal)
-
-IMPORTANT: You have access to background information about the product/service being sold. Use this information to:
-- Ask informed questions that a real customer would ask
-- Challenge claims with specific concerns
-- Reference features or capabilities mentioned in the documentation
-- Only use information that would be realistic for a customer to know or ask about""",
-            
-            "Presentation": """You are an expert presentation coach. Your role is to:
-- Help prepare for presentations
-- Focus on structure, clarity, and engagement
-- Provide feedback on delivery and content
-- Help manage Q&A scenarios""",
-            
-            "Other": """You are an expert communication coach. Your role is to:
-- Help prepare for various communication scenarios
-- Provide constructive feedback
-- Focus on clarity and effectiveness
-- Maintain a supportive tone"""
-        }
-        
-        system_prompt = system_prompts.get(preparation_type, system_prompts["Other"])
+        system_prompt = SESSION_SYSTEM_PROMPTS.get(preparation_type, SESSION_SYSTEM_PROMPTS["Other"])
         
         # Add context to system prompt
         agenda = context_payload.get("agenda", "")
@@ -679,24 +739,29 @@ IMPORTANT: You have access to background information about the product/service b
         if meeting_subtype:
             system_prompt += f"\n\nFocus area: {meeting_subtype}"
         
-        # Add RAG context if available
-        if retrieved_context and len(retrieved_context) > 0:
-            context_text = "\n\n=== BACKGROUND INFORMATION ===\n"
-            context_text += "The following information is available about the product/service being discussed:\n\n"
-            
-            for i, chunk in enumerate(retrieved_context[:5], 1):  # Limit to top 5 chunks
-                context_text += f"[Source {i}]\n{chunk['text']}\n\n"
-            
-            context_text += "=== END BACKGROUND INFORMATION ===\n"
-            context_text += "\nUse this information naturally in your questions and responses. "
-            context_text += "Ask questions that show you've done research or have specific concerns based on this information."
-            
-            system_prompt += context_text
-        
         system_prompt += f"\n\nMaintain a {tone} tone throughout the conversation."
         
-        # Build messages list
-        messages = [{"role": "system", "content": system_prompt}]
+        return system_prompt
+    
+    def _construct_session_prompt(
+        self,
+        context_prompt: str,
+        transcript: List[dict],
+        retrieved_context: Optional[List[Dict[str, any]]] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Construct prompt for preparation session with optional RAG context.
+        
+        Args:
+            context_prompt: Static system prompt for the session
+            transcript: Conversation history
+            retrieved_context: Optional retrieved document chunks
+            
+        Returns:
+            List of message dictionaries for OpenAI API
+        """
+        # Build messages list, static prefix first
+        messages = [{"role": "system", "content": context_prompt}]
         
         # Add conversation history (limit to last 10 messages for context window)
         recent_transcript = transcript[-10:] if len(transcript) > 10 else transcript
@@ -707,6 +772,21 @@ IMPORTANT: You have access to background information about the product/service b
                 "content": msg["message"]
             })
         
+        # Add RAG context if available. It changes every turn, so it goes
+        # just before the latest user message rather than into the prefix.
+        if retrieved_context and len(retrieved_context) > 0:
+            context_text = "=== BACKGROUND INFORMATION ===\n"
+            context_text += "The following information is available about the product/service being discussed:\n\n"
+            
+            for i, chunk in enumerate(retrieved_context[:5], 1):  # Limit to top 5 chunks
+                context_text += f"[Source {i}]\n{chunk['text']}\n\n"
+            
+            context_text += "=== END BACKGROUND INFORMATION ===\n"
+            context_text += "\nUse this information naturally in your questions and responses. "
+            context_text += "Ask questions that show you've done research or have specific concerns based on this information."
+            
+            messages.insert(max(len(messages) - 1, 1), {"role": "system", "content": context_text})
+        
         return messages
     
     async def evaluate_session(
@@ -763,9 +843,32 @@ IMPORTANT: You have access to background information about the product/service b
                 f"completion: {usage.completion_tokens})"
             )
             
+            # Store improvement areas as the model normalizes them, so the
+            # allowed levels and priorities are defined in one place
+            evaluation_data["improvement_areas"] = [
+                ImprovementArea.model_validate(improvement).model_dump()
+                for improvement in evaluation_data.get("improvement_areas") or []
+                if isinstance(improvement, dict)
+            ]
+            
+            # Keep overall_score valid, since analytics and score rankings read
+            # the stored value; fall back to the mean of the universal scores
+            overall_score = evaluation_data.get("overall_score")
+            if not isinstance(overall_score, (int, float)) or not 0 <= overall_score <= 100:
+                scores = [
+                    score for score in (evaluation_data.get("universal_scores") or {}).values()
+                    if isinstance(score, (int, float))
+                ]
+                overall_score = sum(scores) / len(scores) if scores else 0
+                logger.warning(f"Invalid overall_score, calculated as average: {overall_score:.0f}")
+            evaluation_data["overall_score"] = round(overall_score)
+            
+            # Context scores vary by preparation type; keep them only as a
+            # flat name -> score mapping
+            evaluation_data["context_scores"] = coerce_context_scores(evaluation_data.get("context_scores"))
+            
             # Validate and add evaluation_id
-            from uuid import uuid4
-            evaluation_data["evaluation_id"] = str(uuid4())
+            evaluation_data["evaluation_id"] = new_uuid()
             
             return evaluation_data
             
@@ -1029,11 +1132,10 @@ Return your response as a valid JSON object with the specified fields."""
                 raise ValueError("Generated playbook missing required fields")
             
             # Convert scenarios to proper format with IDs
-            from uuid import uuid4
             formatted_scenarios = []
             for scenario in playbook_data.get("scenarios", []):
                 formatted_scenarios.append({
-                    "id": str(uuid4()),
+                    "id": new_uuid(),
                     "title": scenario.get("title", "Untitled Scenario"),
                     "deal_stage": scenario.get("deal_stage", "Discovery"),
                     "meeting_context": scenario.get("meeting_context"),
@@ -1229,10 +1331,10 @@ Return your response as a valid JSON object with the specified fields."""
                 f"completion: {usage.completion_tokens})"
             )
             
-            # Import ContentSection model
-            from app.models.playbook import ContentSection
-            
-            # Validate and create ContentSection
+            # Clean up generated string lists, then validate and create ContentSection
+            for field in CONTENT_STRING_LIST_FIELDS:
+                if field in content_data:
+                    content_data[field] = clean_string_list(content_data[field])
             content_section = ContentSection(**content_data)
             
             return content_section
@@ -1246,4 +1348,12 @@ Return your response as a valid JSON object with the specified fields."""
 
 
 # Create a singleton instance
-openai_service = OpenAIService()
\ No newline at end of file
+openai_service = OpenAIService()
+
+
+async def close_openai_client():
+    """
+    Close the shared OpenAI HTTP client.
+    Called during FastAPI shutdown event.
+    """
+    await openai_service.client.close()
@@ -3,7 +3,9 @@ RAG (Retrieval Augmented Generation) service for knowledge base management.
 Handles document indexing, vector search, and context retrieval using ChromaDB.
 """
 import os
+import hashlib
 import logging
+from array import array
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import chromadb
@@ -11,9 +13,15 @@ from chromadb.config import Settings
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_openai import OpenAIEmbeddings
 import tiktoken
+from cachetools import LRUCache
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Number of query embeddings kept in memory; stored as float32 arrays (~6KB each)
+QUERY_EMBEDDING_CACHE_SIZE = 4096
+
 
 class RAGService:
     """Service for managing document embeddings and retrieval."""
@@ -41,9 +49,13 @@ class RAGService:
         # Initialize OpenAI embeddings
         self.embeddings = OpenAIEmbeddings(
             openai_api_key=openai_api_key,
-            model="text-embedding-3-small"
+            model=EMBEDDING_MODEL
         )
         
+        # Query texts are often repeated (e.g. talk points built from the same
+        # persona and deal stage), so their embeddings are cached
+        self._query_embedding_cache: LRUCache = LRUCache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)
+        
         # Initialize text splitter
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=1000,
@@ -158,6 +170,25 @@ class RAGService:
             logger.error(f"Error generating embeddings: {e}")
             raise
     
+    async def embed_query(self, text: str) -> List[float]:
+        """
+        Generate the embedding for a query text, reusing cached embeddings.
+        
+        Args:
+            text: Query text
+            
+        Returns:
+            Embedding vector
+        """
+        key = hashlib.sha256(f"{EMBEDDING_MODEL}:{text}".encode()).digest()
+        cached = self._query_embedding_cache.get(key)
+        if cached is not None:
+            return cached.tolist()
+        
+        embedding = await self.embeddings.aembed_query(text)
+        self._query_embedding_cache[key] = array("f", embedding)
+        return embedding
+    
     async def query(
         self,
         user_id: str,
@@ -182,7 +213,7 @@ class RAGService:
             collection = self._get_or_create_collection(user_id)
             
             # Generate query embedding
-            query_embedding = await self.embeddings.aembed_query(query_text)
+            query_embedding = await self.embed_query(query_text)
             
             # Query ChromaDB
             results = collection.query(
@@ -196,6 +227,7 @@ class RAGService:
             if results and results['documents'] and len(results['documents']) > 0:
                 for i in range(len(results['documents'][0])):
                     formatted_results.append({
+                        "chunk_id": results['ids'][0][i],
                         "text": results['documents'][0][i],
                         "metadata": results['metadatas'][0][i] if results['metadatas'] else {},
                         "distance": results['distances'][0][i] if results['distances'] else None,
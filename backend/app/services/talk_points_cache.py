@@ -0,0 +1,339 @@
+"""
+Cache for generated talk points.
+
+Identical requests are served from an exact-match entry keyed by a hash of the
+inputs. Near-identical requests are served from a semantic match, which is only
+accepted when the request embedding is very similar AND the knowledge base
+returned (almost) the same chunks, so answers never outlive the context they
+were grounded on. Entries expire through a TTL index on createdAt, after
+settings.TALK_POINTS_CACHE_TTL_SECONDS.
+
+Company profiles and tiers, which rarely change, are also cached in-process
+for a minute so talk point generation doesn't need a users lookup on every
+request, and the generic RAG context used for requests without any inputs is
+kept as a per-user snapshot that is refreshed hourly.
+"""
+import asyncio
+import hashlib
+import logging
+import math
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from cachetools import TTLCache
+
+from app.models._factories import utcnow
+
+logger = logging.getLogger(__name__)
+
+# Minimum cosine similarity between request embeddings for a semantic hit
+SIMILARITY_THRESHOLD = 0.95
+
+# Minimum Jaccard overlap between the retrieved chunk ids for a semantic hit
+CHUNK_OVERLAP_THRESHOLD = 0.8
+
+# Number of recent entries compared against on a semantic lookup
+SEMANTIC_CANDIDATES = 20
+
+# How long a user's generic RAG context snapshot is reused
+GENERIC_CONTEXT_REFRESH = timedelta(hours=1)
+
+# Company profile and tier by user_id. The cache is per process and nothing in
+# the API writes these fields, so entries are kept short-lived instead of being
+# invalidated; a change made directly in the database shows up within a minute
+_company_profile_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def build_cache_key(
+    user_id: str,
+    customer_name: str,
+    customer_persona: str,
+    deal_stage: str,
+    context: str,
+    model: str
+) -> str:
+    """
+    Build the exact-match cache key for a talk points request.
+
+    Args:
+        user_id: User ID
+        customer_name: Target customer name
+        customer_persona: Customer persona/role
+        deal_stage: Current deal stage
+        context: Additional context
+        model: OpenAI model used for generation
+
+    Returns:
+        Hex SHA-256 digest of the inputs
+    """
+    raw = f"{user_id}|{customer_name}|{customer_persona}|{deal_stage}|{context}|{model}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def build_semantic_text(
+    customer_name: str,
+    customer_persona: str,
+    deal_stage: str,
+    context: str
+) -> str:
+    """Build the text embedded for semantic cache lookups."""
+    return f"{customer_name}\n{customer_persona}\n{deal_stage}\n{context}"
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    """Scale a vector to unit length so cosine similarity is a dot product."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return list(vector)
+    return [x / norm for x in vector]
+
+
+def _customer_key(customer_name: str) -> str:
+    """Normalize a customer name so casing and stray whitespace still match."""
+    return " ".join(customer_name.split()).lower()
+
+
+def _jaccard(a: List[str], b: List[str]) -> float:
+    """Jaccard overlap of two id lists; two empty lists are identical."""
+    set_a, set_b = set(a), set(b)
+    if not set_a and not set_b:
+        return 1.0
+    return len(set_a & set_b) / len(set_a | set_b)
+
+
+async def lookup(db, key: str) -> Optional[str]:
+    """
+    Look up an exact-match cache entry.
+
+    Args:
+        db: Database connection
+        key: Cache key from build_cache_key
+
+    Returns:
+        Cached talk points, or None on a miss
+    """
+    try:
+        entry = await db.talk_point_cache.find_one({"_id": key}, {"content": 1})
+    except Exception as e:
+        logger.warning(f"Talk points cache lookup failed: {e}")
+        return None
+
+    return entry["content"] if entry else None
+
+
+async def lookup_similar(
+    db,
+    user_id: str,
+    customer_name: str,
+    model: str,
+    embedding: List[float],
+    chunk_ids: List[str]
+) -> Optional[str]:
+    """
+    Look up a semantically equivalent cache entry.
+
+    Args:
+        db: Database connection
+        user_id: User ID
+        customer_name: Target customer name; entries never cross customers
+        model: OpenAI model used for generation
+        embedding: Embedding of the request text
+        chunk_ids: Ids of the chunks retrieved for this request
+
+    Returns:
+        Cached talk points, or None if no entry passes both gates
+    """
+    # Only entries sharing at least one chunk can pass the overlap gate
+    chunk_filter = {"$in": chunk_ids} if chunk_ids else {"$size": 0}
+
+    try:
+        candidates = await db.talk_point_cache.find(
+            {
+                "user_id": user_id,
+                "customer_name": _customer_key(customer_name),
+                "model": model,
+                "chunk_ids": chunk_filter
+            },
+            {"embedding": 1, "chunk_ids": 1, "content": 1}
+        ).sort("createdAt", -1).limit(SEMANTIC_CANDIDATES).to_list(SEMANTIC_CANDIDATES)
+    except Exception as e:
+        logger.warning(f"Talk points semantic cache lookup failed: {e}")
+        return None
+
+    if not candidates:
+        return None
+
+    # Comparing 1536-dimension vectors in Python would stall the event loop
+    best_content, best_similarity = await asyncio.to_thread(
+        _best_match, embedding, chunk_ids, candidates
+    )
+
+    if best_content is not None:
+        logger.info(f"Semantic talk points cache hit (similarity {best_similarity:.3f})")
+    return best_content
+
+
+def _best_match(
+    embedding: List[float],
+    chunk_ids: List[str],
+    candidates: List[Dict[str, Any]]
+) -> Tuple[Optional[str], float]:
+    """Pick the most similar candidate that passes both semantic cache gates."""
+    query_vector = _normalize(embedding)
+
+    best_content = None
+    best_similarity = SIMILARITY_THRESHOLD
+    for entry in candidates:
+        if _jaccard(chunk_ids, entry.get("chunk_ids", [])) < CHUNK_OVERLAP_THRESHOLD:
+            continue
+        similarity = sum(a * b for a, b in zip(query_vector, entry.get("embedding", [])))
+        if similarity < best_similarity:
+            continue
+        best_content = entry["content"]
+        best_similarity = similarity
+
+    return best_content, best_similarity
+
+
+async def store(
+    db,
+    key: str,
+    user_id: str,
+    customer_name: str,
+    model: str,
+    embedding: List[float],
+    chunk_ids: List[str],
+    content: str
+) -> None:
+    """
+    Store generated talk points in the cache.
+
+    Args:
+        db: Database connection
+        key: Cache key from build_cache_key
+        user_id: User ID
+        customer_name: Target customer name the talk points address
+        model: OpenAI model used for generation
+        embedding: Embedding of the request text
+        chunk_ids: Ids of the chunks the talk points were grounded on
+        content: Generated talk points
+    """
+    try:
+        await db.talk_point_cache.replace_one(
+            {"_id": key},
+            {
+                "user_id": user_id,
+                "customer_name": _customer_key(customer_name),
+                "model": model,
+                "embedding": _normalize(embedding),
+                "chunk_ids": chunk_ids,
+                "content": content,
+                "createdAt": utcnow()
+            },
+            upsert=True
+        )
+    except Exception as e:
+        logger.warning(f"Failed to store talk points in cache: {e}")
+
+
+async def invalidate_user(db, user_id: str) -> None:
+    """
+    Drop all cached talk points for a user, e.g. after their knowledge base changes.
+
+    Args:
+        db: Database connection
+        user_id: User ID
+    """
+    try:
+        await db.talk_point_cache.delete_many({"user_id": user_id})
+        await db.rag_generic_cache.delete_one({"_id": user_id})
+    except Exception as e:
+        logger.warning(f"Failed to invalidate talk points cache for user {user_id}: {e}")
+
+
+async def _get_cached_user(db, user_id: str) -> Dict[str, Any]:
+    """Fetch the user fields used for talk point generation, cached in-process."""
+    user = _company_profile_cache.get(user_id)
+    if user is None:
+        user = await db.users.find_one(
+            {"user_id": user_id},
+            {"company_profile": 1, "tier": 1, "_id": 0}
+        ) or {}
+        _company_profile_cache[user_id] = user
+    return user
+
+
+async def get_company_profile(db, user_id: str) -> Dict[str, Any]:
+    """
+    Get a user's company profile, served from memory when recently fetched.
+
+    Args:
+        db: Database connection
+        user_id: User ID
+
+    Returns:
+        Company profile, or an empty dict if the user has none
+    """
+    user = await _get_cached_user(db, user_id)
+    return user.get("company_profile") or {}
+
+
+async def get_user_tier(db, user_id: str) -> str:
+    """
+    Get a user's subscription tier, served from memory when recently fetched.
+
+    Args:
+        db: Database connection
+        user_id: User ID
+
+    Returns:
+        Subscription tier, "standard" if none is set
+    """
+    user = await _get_cached_user(db, user_id)
+    return user.get("tier") or "standard"
+
+
+async def get_generic_context(
+    db,
+    rag_service,
+    user_id: str,
+    query_text: str,
+    top_k: int
+) -> List[Dict[str, Any]]:
+    """
+    Get the user's generic RAG context, refreshing the stored snapshot when stale.
+
+    Args:
+        db: Database connection
+        rag_service: RAG service used to refresh the snapshot
+        user_id: User ID
+        query_text: Generic query run on refresh
+        top_k: Number of chunks to retrieve on refresh
+
+    Returns:
+        Retrieved chunks, as returned by RAGService.query
+    """
+    now = utcnow()
+    try:
+        # Only a snapshot that is still fresh is returned
+        snapshot = await db.rag_generic_cache.find_one(
+            {"_id": user_id, "refresh_at": {"$gt": now}},
+            {"chunks": 1}
+        )
+        if snapshot:
+            return snapshot["chunks"]
+    except Exception as e:
+        logger.warning(f"Generic context cache lookup failed: {e}")
+
+    chunks = await rag_service.query(user_id=user_id, query_text=query_text, top_k=top_k)
+
+    try:
+        await db.rag_generic_cache.replace_one(
+            {"_id": user_id},
+            {"chunks": chunks, "refresh_at": now + GENERIC_CONTEXT_REFRESH},
+            upsert=True
+        )
+    except Exception as e:
+        logger.warning(f"Failed to store generic context for user {user_id}: {e}")
+
+    return chunks
@@ -0,0 +1,180 @@
+"""
+Shared fixtures for the API route tests.
+
+Routes run against in-memory stand-ins for the Motor collections, so the
+tests need neither MongoDB nor OpenAI. Authentication is replaced with a
+fixed user through FastAPI's dependency overrides.
+"""
+import os
+from datetime import datetime
+
+# Settings are read when app.main is imported
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017/prapp_test")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.dependencies import get_current_user
+from app.db.mongodb import get_database
+from app.main import app
+from app.services import talk_points_cache
+
+TEST_USER = {"user_id": "user-1", "email": "user@example.com"}
+
+
+def matches(doc: dict, query: dict) -> bool:
+    """Evaluate the subset of MongoDB filter syntax used by the routes."""
+    for field, condition in query.items():
+        value = doc.get(field)
+        if isinstance(condition, dict):
+            for operator, operand in condition.items():
+                if operator == "$in":
+                    values = value if isinstance(value, list) else [value]
+                    if not set(values) & set(operand):
+                        return False
+                elif operator == "$size":
+                    if not isinstance(value, list) or len(value) != operand:
+                        return False
+                elif operator == "$gt":
+                    if value is None or not value > operand:
+                        return False
+                else:
+                    raise NotImplementedError(operator)
+        elif value != condition:
+            return False
+    return True
+
+
+def to_bson(value):
+    """Round-trip a value the way MongoDB stores it: datetimes keep only milliseconds."""
+    if isinstance(value, datetime):
+        return value.replace(microsecond=value.microsecond // 1000 * 1000)
+    if isinstance(value, dict):
+        return {key: to_bson(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_bson(item) for item in value]
+    return value
+
+
+def project(doc: dict, projection) -> dict:
+    """Apply an inclusion projection; _id is never stored by the fakes."""
+    if not projection:
+        return dict(doc)
+    included = [field for field, flag in projection.items() if flag and field != "_id"]
+    if not included:
+        return dict(doc)
+    return {field: doc[field] for field in included if field in doc}
+
+
+class FakeCursor:
+    """In-memory stand-in for a Motor cursor; like MongoDB, it sorts before projecting."""
+
+    def __init__(self, docs, projection=None):
+        self.docs = list(docs)
+        self.projection = projection
+
+    def sort(self, key, direction=1):
+        self.docs.sort(key=lambda doc: doc.get(key), reverse=direction == -1)
+        return self
+
+    def limit(self, count):
+        self.docs = self.docs[:count]
+        return self
+
+    async def to_list(self, length=None):
+        docs = self.docs if length is None else self.docs[:length]
+        return [project(doc, self.projection) for doc in docs]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            yield project(doc, self.projection)
+
+
+class FakeCollection:
+    """
+    In-memory stand-in for a Motor collection.
+
+    Aggregations are not evaluated: aggregate() records the pipeline and
+    returns whatever the test put in aggregate_results.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.docs = []
+        self.pipelines = []
+        self.aggregate_results = []
+
+    async def find_one(self, query, projection=None, sort=None):
+        cursor = self.find(query, projection)
+        if sort:
+            key, direction = sort[0]
+            cursor.sort(key, direction)
+        docs = await cursor.to_list(1)
+        return docs[0] if docs else None
+
+    def find(self, query=None, projection=None):
+        return FakeCursor((doc for doc in self.docs if matches(doc, query or {})), projection)
+
+    def aggregate(self, pipeline):
+        self.pipelines.append(pipeline)
+        return FakeCursor(self.aggregate_results)
+
+    async def insert_one(self, doc):
+        self.docs.append(to_bson(doc))
+
+    async def replace_one(self, query, doc, upsert=False):
+        self.docs = [existing for existing in self.docs if not matches(existing, query)]
+        if "_id" in query:
+            doc = {**doc, "_id": query["_id"]}
+        self.docs.append(to_bson(doc))
+
+    async def delete_many(self, query):
+        self.docs = [doc for doc in self.docs if not matches(doc, query)]
+
+    async def delete_one(self, query):
+        await self.delete_many(query)
+
+
+class FakeDatabase:
+    """In-memory stand-in for a Motor database; collections are created on access."""
+
+    def __init__(self):
+        self.collections = {}
+
+    def __getitem__(self, name: str) -> FakeCollection:
+        if name not in self.collections:
+            self.collections[name] = FakeCollection(name)
+        return self.collections[name]
+
+    def __getattr__(self, name: str) -> FakeCollection:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self[name]
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    """Fresh in-memory database wired into every route that talks to MongoDB."""
+    db = FakeDatabase()
+
+    monkeypatch.setattr("app.api.sessions.get_collection", db.__getitem__)
+    app.dependency_overrides[get_database] = lambda: db
+    talk_points_cache._company_profile_cache.clear()
+
+    yield db
+
+    app.dependency_overrides.pop(get_database, None)
+
+
+@pytest.fixture
+def client(fake_db):
+    """Test client authenticated as TEST_USER; the lifespan (and MongoDB) is not started."""
+    app.dependency_overrides[get_current_user] = lambda: TEST_USER
+
+    yield TestClient(app)
+
+    app.dependency_overrides.pop(get_current_user, None)
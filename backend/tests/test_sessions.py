@@ -0,0 +1,183 @@
+"""
+Route tests for session endpoints.
+"""
+import json
+from datetime import datetime
+
+from app.api import sessions
+
+SESSION_ID = "session-1"
+
+
+def make_session(session_id=SESSION_ID, user_id="user-1", **overrides) -> dict:
+    """Build a stored session document."""
+    session = {
+        "session_id": session_id,
+        "user_id": user_id,
+        "preparation_type": "Sales",
+        "meeting_subtype": None,
+        "context_payload": {"tone": "Professional & Confident"},
+        "transcript": [
+            {"role": "ai", "message": "Tell me about the deal.", "timestamp": datetime(2026, 2, 13, 3, 0)},
+            {"role": "user", "message": "It's a renewal.", "timestamp": datetime(2026, 2, 13, 3, 1)},
+        ],
+        "status": "completed",
+        "created_at": datetime(2026, 2, 13, 3, 0),
+        "completed_at": datetime(2026, 2, 13, 3, 30),
+    }
+    session.update(overrides)
+    return session
+
+
+def make_evaluation(session_id=SESSION_ID, evaluation_id="evaluation-1", **overrides) -> dict:
+    """Build a stored session evaluation document."""
+    evaluation = {
+        "evaluation_id": evaluation_id,
+        "session_id": session_id,
+        "user_id": "user-1",
+        "universal_scores": {
+            "clarity_structure": 85,
+            "relevance_focus": 90,
+            "confidence_delivery": 75,
+            "language_quality": 88,
+            "tone_alignment": 82,
+            "engagement": 80,
+        },
+        "context_scores": None,
+        "improvement_areas": [{
+            "dimension": "Confidence & Delivery",
+            "current_level": "solid",
+            "suggestion": "Pause briefly before answering",
+            "priority": "high",
+        }],
+        "practice_suggestions": ["Practice quantifying your impact"],
+        "strengths": ["Clear communication"],
+        "overall_score": 83,
+        "summary": "Strong performance overall",
+        "created_at": datetime(2026, 2, 13, 3, 35),
+    }
+    evaluation.update(overrides)
+    return evaluation
+
+
+def test_get_session_full_includes_evaluation(client, fake_db):
+    fake_db.sessions.aggregate_results = [{**make_session(), "evaluation": make_evaluation()}]
+
+    response = client.get(f"/api/v1/sessions/{SESSION_ID}/full")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["session_id"] == SESSION_ID
+    assert len(body["transcript"]) == 2
+    assert body["evaluation"]["evaluation_id"] == "evaluation-1"
+    assert body["evaluation"]["overall_score"] == 83
+
+    # Ownership is part of the $match, so other users' sessions are never joined
+    pipeline = fake_db.sessions.pipelines[0]
+    assert pipeline[0] == {"$match": {"session_id": SESSION_ID, "user_id": "user-1"}}
+    assert pipeline[1]["$lookup"]["from"] == "session_evaluations"
+
+
+def test_get_session_full_without_evaluation(client, fake_db):
+    fake_db.sessions.aggregate_results = [make_session(status="in_progress", completed_at=None)]
+
+    response = client.get(f"/api/v1/sessions/{SESSION_ID}/full")
+
+    assert response.status_code == 200
+    assert response.json()["evaluation"] is None
+
+
+def test_get_session_full_not_found(client, fake_db):
+    response = client.get("/api/v1/sessions/missing/full")
+
+    assert response.status_code == 404
+
+
+def test_stream_sessions_yields_ndjson_newest_first(client, fake_db):
+    fake_db.sessions.docs = [
+        make_session("older", created_at=datetime(2026, 2, 1)),
+        make_session("newer", created_at=datetime(2026, 2, 10)),
+        make_session("someone-else", user_id="user-2"),
+    ]
+
+    response = client.get("/api/v1/sessions/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["session_id"] for line in lines] == ["newer", "older"]
+    assert lines[0]["transcript"][1]["message"] == "It's a renewal."
+
+
+def test_stream_sessions_filters_by_status(client, fake_db):
+    fake_db.sessions.docs = [
+        make_session("done"),
+        make_session("open", status="in_progress", completed_at=None),
+    ]
+
+    response = client.get("/api/v1/sessions/stream", params={"status_filter": "in_progress"})
+
+    assert response.status_code == 200
+    assert [json.loads(line)["session_id"] for line in response.text.splitlines()] == ["open"]
+
+
+def test_evaluate_session_returns_304_for_matching_etag(client, fake_db):
+    fake_db.sessions.docs = [make_session()]
+    fake_db.session_evaluations.docs = [make_evaluation()]
+
+    first = client.post(f"/api/v1/sessions/{SESSION_ID}/evaluate")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    repeat = client.post(f"/api/v1/sessions/{SESSION_ID}/evaluate", headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.headers["etag"] == etag
+    assert repeat.content == b""
+
+
+def stub_evaluation(monkeypatch, **overrides):
+    """Make the OpenAI service return a fresh evaluation without calling OpenAI."""
+    async def evaluate_session(**kwargs):
+        evaluation = make_evaluation(**overrides)
+        for field in ("session_id", "user_id", "created_at"):
+            evaluation.pop(field)
+        return evaluation
+
+    monkeypatch.setattr(sessions.openai_service, "evaluate_session", evaluate_session)
+
+
+def test_new_evaluation_etag_matches_on_repoll(client, fake_db, monkeypatch):
+    fake_db.sessions.docs = [make_session()]
+    stub_evaluation(monkeypatch)
+
+    first = client.post(f"/api/v1/sessions/{SESSION_ID}/evaluate")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    # The stored copy has created_at truncated to milliseconds
+    repeat = client.post(f"/api/v1/sessions/{SESSION_ID}/evaluate", headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.headers["etag"] == etag
+
+
+def test_forced_reevaluation_changes_etag(client, fake_db, monkeypatch):
+    fake_db.sessions.docs = [make_session()]
+    fake_db.session_evaluations.docs = [make_evaluation()]
+    stub_evaluation(monkeypatch, evaluation_id="evaluation-2", overall_score=91)
+
+    stale_etag = client.post(f"/api/v1/sessions/{SESSION_ID}/evaluate").headers["etag"]
+
+    forced = client.post(
+        f"/api/v1/sessions/{SESSION_ID}/evaluate",
+        json={"force_reevaluate": True},
+        headers={"If-None-Match": stale_etag}
+    )
+    assert forced.status_code == 200
+    assert forced.json()["evaluation_id"] == "evaluation-2"
+    assert forced.headers["etag"] != stale_etag
+
+    # The regenerated evaluation is served to clients still holding the old ETag
+    refreshed = client.post(f"/api/v1/sessions/{SESSION_ID}/evaluate", headers={"If-None-Match": stale_etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json()["overall_score"] == 91
+    assert refreshed.headers["etag"] == forced.headers["etag"]
@@ -0,0 +1,225 @@
+"""
+Route tests for talk points endpoints.
+"""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.api import talk_points
+from app.core.config import settings
+
+CHUNKS = [
+    {"chunk_id": "chunk-1", "text": "Our platform cuts onboarding time in half."},
+    {"chunk_id": "chunk-2", "text": "SOC 2 Type II certified."},
+]
+
+REQUEST = {
+    "customer_name": "Acme Corp",
+    "customer_persona": "Technical CTO",
+    "deal_stage": "Proposal",
+    "context": "Renewal after a pricing change",
+}
+
+
+class FakeRAGService:
+    """RAG service returning fixed chunks and a fixed request embedding."""
+
+    def __init__(self):
+        self.queries = []
+        self.embedding = [1.0, 0.0, 0.0]
+
+    async def query(self, user_id, query_text, top_k=5, filter_metadata=None):
+        self.queries.append(query_text)
+        return CHUNKS
+
+    async def embed_query(self, text):
+        return self.embedding
+
+
+class FakeCompletions:
+    """Chat completions stand-in that records every request."""
+
+    def __init__(self, deltas):
+        self.deltas = deltas
+        self.finish_reason = "stop"
+        self.calls = []
+
+    async def create(self, stream=False, **kwargs):
+        self.calls.append(kwargs)
+        if stream:
+            return self._stream()
+        usage = SimpleNamespace(total_tokens=30, prompt_tokens=20, completion_tokens=10)
+        message = SimpleNamespace(content="".join(self.deltas))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+    async def _stream(self):
+        for delta in self.deltas:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta), finish_reason=None)])
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=None), finish_reason=self.finish_reason)])
+
+
+@pytest.fixture
+def rag(monkeypatch):
+    service = FakeRAGService()
+    monkeypatch.setattr(talk_points, "get_rag_service", lambda openai_api_key: service)
+    return service
+
+
+@pytest.fixture
+def completions(monkeypatch):
+    fake = FakeCompletions(["## Opening Strategy\n", "- Lead with onboarding time\n"])
+    client = SimpleNamespace(chat=SimpleNamespace(completions=fake))
+    monkeypatch.setattr(talk_points.openai_service, "client", client)
+    return fake
+
+
+def read_events(response) -> list:
+    """Decode the data payloads of a Server-Sent Events response."""
+    return [
+        json.loads(line[len("data: "):])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+def test_generate_stream_sends_deltas_then_saves(client, fake_db, rag, completions):
+    response = client.post("/api/v1/talk-points/generate/stream", json=REQUEST)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = read_events(response)
+    assert [event["delta"] for event in events[:-1]] == completions.deltas
+    assert events[-1]["done"] is True
+
+    # The talk point is saved under the announced id once the stream ends
+    saved = fake_db.talk_points.docs
+    assert len(saved) == 1
+    assert saved[0]["talk_point_id"] == events[-1]["talk_point_id"]
+    assert saved[0]["generated_content"] == "".join(completions.deltas)
+    assert len(fake_db.talk_point_cache.docs) == 1
+
+
+def test_generate_stream_serves_cached_content_without_openai(client, fake_db, rag, completions):
+    client.post("/api/v1/talk-points/generate/stream", json=REQUEST)
+
+    response = client.post("/api/v1/talk-points/generate/stream", json=REQUEST)
+
+    events = read_events(response)
+    assert events[0] == {"delta": "".join(completions.deltas)}
+    assert events[-1]["done"] is True
+    assert len(completions.calls) == 1
+    assert len(fake_db.talk_points.docs) == 2
+
+
+def test_generate_stream_does_not_save_truncated_output(client, fake_db, rag, completions):
+    completions.finish_reason = "length"
+
+    response = client.post("/api/v1/talk-points/generate/stream", json=REQUEST)
+
+    events = read_events(response)
+    assert "error" in events[-1]
+    assert not any(event.get("done") for event in events)
+    assert fake_db.talk_points.docs == []
+    assert fake_db.talk_point_cache.docs == []
+
+
+def test_generate_stream_reports_failure_and_does_not_save(client, fake_db, rag, completions, monkeypatch):
+    async def failing_stream():
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="## Opening"), finish_reason=None)])
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setattr(completions, "_stream", failing_stream)
+
+    response = client.post("/api/v1/talk-points/generate/stream", json=REQUEST)
+
+    events = read_events(response)
+    assert events[0] == {"delta": "## Opening"}
+    assert "error" in events[-1]
+    assert fake_db.talk_points.docs == []
+    assert fake_db.talk_point_cache.docs == []
+
+
+@pytest.mark.parametrize("tier, setting", [
+    (None, "TALK_POINTS_MODEL_DEFAULT"),
+    ("standard", "TALK_POINTS_MODEL_DEFAULT"),
+    ("premium", "TALK_POINTS_MODEL_PREMIUM"),
+])
+def test_generate_picks_model_by_tier(client, fake_db, rag, completions, tier, setting):
+    fake_db.users.docs = [{"user_id": "user-1", "tier": tier}]
+
+    response = client.post("/api/v1/talk-points/generate", json=REQUEST)
+
+    assert response.status_code == 201
+    call = completions.calls[0]
+    assert call["model"] == getattr(settings, setting)
+    assert call["max_tokens"] == settings.TALK_POINTS_MAX_TOKENS
+
+
+def test_generate_exact_cache_hit_skips_rag_and_openai(client, fake_db, rag, completions):
+    first = client.post("/api/v1/talk-points/generate", json=REQUEST)
+    rag_queries = len(rag.queries)
+
+    second = client.post("/api/v1/talk-points/generate", json=REQUEST)
+
+    assert second.status_code == 201
+    assert second.json()["generated_content"] == first.json()["generated_content"]
+    assert len(completions.calls) == 1
+    assert len(rag.queries) == rag_queries
+
+
+def test_generate_semantic_cache_hit(client, fake_db, rag, completions):
+    client.post("/api/v1/talk-points/generate", json=REQUEST)
+
+    # Reworded request: a different exact key, but a near-identical embedding
+    # and the same retrieved chunks
+    rag.embedding = [0.999, 0.01, 0.0]
+    response = client.post("/api/v1/talk-points/generate", json={**REQUEST, "context": "Renewal after pricing changed"})
+
+    assert response.status_code == 201
+    assert response.json()["generated_content"] == "".join(completions.deltas)
+    assert len(completions.calls) == 1
+
+
+def test_generate_semantic_cache_is_scoped_to_customer(client, fake_db, rag, completions):
+    client.post("/api/v1/talk-points/generate", json=REQUEST)
+
+    # Same chunks and a near-identical embedding, but another customer
+    rag.embedding = [0.999, 0.01, 0.0]
+    response = client.post("/api/v1/talk-points/generate", json={**REQUEST, "customer_name": "Globex"})
+
+    assert response.status_code == 201
+    assert len(completions.calls) == 2
+    assert {entry["customer_name"] for entry in fake_db.talk_point_cache.docs} == {"acme corp", "globex"}
+
+
+@pytest.mark.parametrize("embedding, chunks", [
+    # Similar request, but the knowledge base returned different chunks
+    ([0.999, 0.01, 0.0], [{"chunk_id": "chunk-3", "text": "New pricing tiers."}]),
+    # Same chunks, but a dissimilar request
+    ([0.0, 1.0, 0.0], CHUNKS),
+])
+def test_generate_semantic_cache_miss(client, fake_db, rag, completions, monkeypatch, embedding, chunks):
+    client.post("/api/v1/talk-points/generate", json=REQUEST)
+
+    rag.embedding = embedding
+
+    async def query(user_id, query_text, top_k=5, filter_metadata=None):
+        return chunks
+
+    monkeypatch.setattr(rag, "query", query)
+    response = client.post("/api/v1/talk-points/generate", json={**REQUEST, "context": "Expansion into a new region"})
+
+    assert response.status_code == 201
+    assert len(completions.calls) == 2
+
+
+def test_list_talk_points_paginates_with_skip(client, fake_db):
+    fake_db.talk_points.aggregate_results = [{"items": [], "total": [{"count": 25}]}]
+
+    response = client.get("/api/v1/talk-points", params={"limit": 10, "skip": 20})
+
+    assert response.status_code == 200
+    assert response.json() == {"talk_points": [], "total": 25, "limit": 10, "skip": 20}
+    items_stages = fake_db.talk_points.pipelines[0][1]["$facet"]["items"]
+    assert {"$skip": 20} in items_stages